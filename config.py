@@ -18,6 +18,10 @@ class ScrapingConfig:
     timeout: int = 30000  # Page timeout in milliseconds
     max_retries: int = 3
     retry_delay: int = 5  # Seconds
+    concurrent_ranges: int = int(os.getenv("SCRAPING_CONCURRENT_RANGES", "0"))  # >0 fetches that many date ranges at once via the results API
+    first_run: bool = os.getenv("SCRAPING_FIRST_RUN", "false").lower() == "true"  # Backfill into an empty collection with plain batched inserts
+    seen_preload_limit: int = int(os.getenv("SCRAPING_SEEN_PRELOAD_LIMIT", "200000"))  # Stored judgment IDs the scraper caches at startup to skip existence queries (0 disables)
+    max_captured_responses: int = int(os.getenv("SCRAPING_MAX_CAPTURED_RESPONSES", "10000"))  # Network responses kept per date range (oldest dropped first)
     
 @dataclass
 class MongoConfig:
@@ -25,6 +29,7 @@ class MongoConfig:
     connection_string: str = os.getenv("MONGO_CONNECTION_STRING", "mongodb://localhost:27017/")
     database_name: str = os.getenv("MONGO_DATABASE", "supreme_court_judgments")
     collection_name: str = os.getenv("MONGO_COLLECTION", "judgments")
+    checkpoints_collection_name: str = os.getenv("MONGO_CHECKPOINTS_COLLECTION", "date_checkpoints")
     
 @dataclass
 class S3Config:
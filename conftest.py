@@ -0,0 +1,49 @@
+"""
+Shared fixtures and helpers for the root-level test scripts
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import dataclasses
+import functools
+from collections import deque
+import pytest
+
+from config import config
+from mongodb_client import get_shared_client
+from supreme_court_scraper import SupremeCourtScraper, _MAX_CAPTURED_RESPONSES
+
+@functools.lru_cache(maxsize=1)
+def _cached_scraper() -> SupremeCourtScraper:
+    """Build the scraper (and its MongoDB/S3 clients) once per process"""
+    # Tests only save a handful of samples, so skip the startup judgment ID scan
+    scraping = dataclasses.replace(config.scraping, seen_preload_limit=0)
+    return SupremeCourtScraper(dataclasses.replace(config, scraping=scraping))
+
+def get_scraper() -> SupremeCourtScraper:
+    """Get the shared scraper with per-test network and duplicate state cleared"""
+    scraper = _cached_scraper()
+    # Tests may swap in plain lists, so rebuild the bounded deque the way the constructor does
+    max_captured = scraper.config.scraping.max_captured_responses or _MAX_CAPTURED_RESPONSES
+    scraper.captured_responses = deque(maxlen=max_captured)
+    scraper.api_endpoints = []
+    scraper._seen_content_keys.clear()
+    scraper._seen_ids.clear()
+    scraper._seen_order.clear()
+    scraper.mongo_client._seen_ids.clear()
+    return scraper
+
+def format_judgments(judgments, label: str = "Judgment", indent: str = "  ") -> str:
+    """Render extracted judgments as one block so each dump is a single write"""
+    lines = []
+    for i, judgment in enumerate(judgments, 1):
+        lines.append(f"\n{label} {i}:")
+        lines.extend(f"{indent}{key}: {value}" for key, value in judgment.items())
+    return "\n".join(lines)
+
+@pytest.fixture(scope="session")
+def mongo_client():
+    """One MongoDB connection for the whole test session (closed at exit)"""
+    return get_shared_client(config.mongo)
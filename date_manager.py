@@ -1,10 +1,10 @@
 from datetime import datetime, timedelta
 from typing import List, Tuple, Generator
 from dataclasses import dataclass
-import json
+import orjson
 from pathlib import Path
 
-@dataclass
+@dataclass(slots=True)
 class DateRange:
     """Represents a date range for scraping"""
     start_date: datetime
@@ -38,11 +38,13 @@ class DateRange:
 class DateManager:
     """Manages date ranges for scraping Supreme Court judgments"""
     
-    def __init__(self, start_year: int, end_year: int, max_days: int = 30):
+    def __init__(self, start_year: int, end_year: int, max_days: int = 30, checkpoint_store=None):
         self.start_year = start_year
         self.end_year = end_year
         self.max_days = max_days
-        self.progress_file = "date_progress.json"
+        self.progress_file = "date_progress.json"  # Legacy full snapshot, still read on load
+        self.journal_file = "date_progress.jsonl"  # Append-only, one line per processed range
+        self.checkpoint_store = checkpoint_store  # MongoDBClient; when set, checkpoints go to MongoDB instead of the journal
         
     def generate_date_ranges(self) -> Generator[DateRange, None, None]:
         """Generate date ranges in chunks of max_days"""
@@ -71,42 +73,90 @@ class DateManager:
         """Get total number of date ranges"""
         return len(self.get_all_date_ranges())
     
+    def _record(self, results: List[Tuple[DateRange, str]]):
+        """Write (range, status) results to the checkpoint store, falling back to the progress journal"""
+        extra = {}
+        if self.checkpoint_store is not None:
+            saved = self.checkpoint_store.save_checkpoints([
+                {"_id": str(r), **r.to_dict(), "status": status} for r, status in results
+            ])
+            if saved == len(results):
+                return
+            
+            # Timestamped like store entries so load_progress can order the two
+            print(f"Checkpoint store saved {saved}/{len(results)} ranges; writing them to {self.journal_file}")
+            extra = {"updated_at": datetime.utcnow().isoformat()}
+        
+        with open(self.journal_file, 'ab') as f:
+            f.write(b"".join(orjson.dumps({**r.to_dict(), "status": status, **extra}) + b"\n" for r, status in results))
+    
+    def append_result(self, date_range: DateRange, success: bool):
+        """Record one processed range"""
+        self._record([(date_range, "completed" if success else "failed")])
+    
     def save_progress(self, completed_ranges: List[DateRange], failed_ranges: List[DateRange] = None):
-        """Save progress to file"""
+        """Record the given completed and failed ranges"""
         if failed_ranges is None:
             failed_ranges = []
-            
-        progress_data = {
-            "completed_ranges": [r.to_dict() for r in completed_ranges],
-            "failed_ranges": [r.to_dict() for r in failed_ranges],
-            "last_updated": datetime.now().isoformat(),
-            "total_completed": len(completed_ranges),
-            "total_failed": len(failed_ranges)
-        }
         
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress_data, f, indent=2)
+        results = [(r, "completed") for r in completed_ranges]
+        results.extend((r, "failed") for r in failed_ranges)
+        self._record(results)
     
     def load_progress(self) -> Tuple[List[DateRange], List[DateRange]]:
-        """Load progress from file"""
-        if not Path(self.progress_file).exists():
-            return [], []
+        """Load progress from the legacy snapshot, the journal and the checkpoint store; the latest status per range wins"""
+        statuses = {}
+        timed_entries = []
         
         try:
-            with open(self.progress_file, 'r') as f:
-                progress_data = json.load(f)
+            if Path(self.progress_file).exists():
+                with open(self.progress_file, 'rb') as f:
+                    progress_data = orjson.loads(f.read())
+                
+                for r in progress_data.get("completed_ranges", []):
+                    statuses[(r["start_date"], r["end_date"])] = "completed"
+                for r in progress_data.get("failed_ranges", []):
+                    statuses.setdefault((r["start_date"], r["end_date"]), "failed")
+            
+            if Path(self.journal_file).exists():
+                with open(self.journal_file, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            entry = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            # A line cut short by a crash mid-write
+                            continue
+                        if "updated_at" in entry:
+                            # Written when the checkpoint store failed; replayed with the store below
+                            timed_entries.append(entry)
+                            continue
+                        key = (entry["start_date"], entry["end_date"])
+                        statuses.pop(key, None)  # Keep replay order = latest result order
+                        statuses[key] = entry["status"]
             
-            completed_ranges = [
-                DateRange.from_dict(r) for r in progress_data.get("completed_ranges", [])
-            ]
-            failed_ranges = [
-                DateRange.from_dict(r) for r in progress_data.get("failed_ranges", [])
-            ]
+            if self.checkpoint_store is not None:
+                timed_entries.extend(self.checkpoint_store.load_checkpoints())
             
-            return completed_ranges, failed_ranges
+            for entry in sorted(timed_entries, key=lambda e: e.get("updated_at", "")):
+                key = (entry["start_date"], entry["end_date"])
+                statuses.pop(key, None)
+                statuses[key] = entry["status"]
         except Exception as e:
             print(f"Error loading progress: {e}")
             return [], []
+        
+        completed_ranges = []
+        failed_ranges = []
+        for (start_date, end_date), status in statuses.items():
+            date_range = DateRange.from_dict({"start_date": start_date, "end_date": end_date})
+            if status == "completed":
+                completed_ranges.append(date_range)
+            else:
+                failed_ranges.append(date_range)
+        
+        return completed_ranges, failed_ranges
     
     def get_remaining_ranges(self) -> List[DateRange]:
         """Get remaining date ranges to process"""
@@ -144,9 +194,12 @@ class DateManager:
         }
     
     def reset_progress(self):
-        """Reset progress file"""
-        if Path(self.progress_file).exists():
-            Path(self.progress_file).unlink()
+        """Reset progress files and stored checkpoints"""
+        for path in (self.progress_file, self.journal_file):
+            if Path(path).exists():
+                Path(path).unlink()
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.clear_checkpoints()
 
 # Example usage and testing
 if __name__ == "__main__":
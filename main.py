@@ -124,7 +124,8 @@ class ScraperCLI:
             date_manager = DateManager(
                 config.scraping.start_year,
                 config.scraping.end_year,
-                config.scraping.max_date_range_days
+                config.scraping.max_date_range_days,
+                checkpoint_store=mongo_client
             )
             
             print("\n" + "="*60)
@@ -192,13 +193,18 @@ class ScraperCLI:
                 print("Reset cancelled.")
                 return
             
+            mongo_client = MongoDBClient(config.mongo)
             date_manager = DateManager(
                 config.scraping.start_year,
                 config.scraping.end_year,
-                config.scraping.max_date_range_days
+                config.scraping.max_date_range_days,
+                checkpoint_store=mongo_client
             )
             
-            # Reset progress file
+            # Reset progress files and MongoDB checkpoints
+            date_manager.reset_progress()
+            mongo_client.close()
+            
             progress_file = Path("scraping_progress.json")
             if progress_file.exists():
                 progress_file.unlink()
@@ -263,6 +269,8 @@ Examples:
   python main.py --reset-progress         # Reset scraping progress
   python main.py --test-captcha           # Test CAPTCHA solving
   python main.py --log-level DEBUG        # Enable debug logging
+  python main.py --concurrency 8          # Fetch 8 date ranges at a time
+  python main.py --first-run              # Backfill an empty database with batched inserts
         """
     )
     
@@ -306,6 +314,14 @@ Examples:
         "--no-headless", action="store_true",
         help="Run browser with GUI (for debugging)"
     )
+    parser.add_argument(
+        "--concurrency", type=int,
+        help="Date ranges to fetch concurrently via the results API (overrides config, 0 = sequential)"
+    )
+    parser.add_argument(
+        "--first-run", action="store_true",
+        help="Initial backfill into an empty collection: skip existence lookups and bulk-insert"
+    )
     
     # Logging options
     parser.add_argument(
@@ -354,6 +370,10 @@ def main():
             config.scraping.headless = True
         if args.no_headless:
             config.scraping.headless = False
+        if args.concurrency is not None:
+            config.scraping.concurrent_ranges = args.concurrency
+        if args.first_run:
+            config.scraping.first_run = True
         
         # Validate environment (except for stats command)
         if not args.stats and not cli.validate_environment():
@@ -1,13 +1,25 @@
-from pymongo import MongoClient, ASCENDING, DESCENDING
-from pymongo.errors import ConnectionFailure, DuplicateKeyError, PyMongoError
+from pymongo import MongoClient, ASCENDING, DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError, PyMongoError
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
 import hashlib
+import atexit
+import threading
 from loguru import logger
 from config import MongoConfig
 
-@dataclass
+# Documents per insert_many call, keeping each request well under the 48 MB message limit
+_INSERT_BATCH_SIZE = 1000
+
+# Characters replaced with '_' in content-derived judgment IDs
+_ID_TRANS = str.maketrans({'/': '_', ' ': '_', ':': '_'})
+
+def make_judgment_id(diary_no: str, case_number: str, judgment_date: str) -> str:
+    """Build the judgment_id used for scraped judgments from its content fields"""
+    return f"{diary_no}_{case_number}_{judgment_date}".translate(_ID_TRANS)
+
+@dataclass(slots=True)
 class JudgmentMetadata:
     """Data class for judgment metadata"""
     judgment_id: str  # Generated hash
@@ -86,8 +98,9 @@ class JudgmentMetadata:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'JudgmentMetadata':
         """Create from dictionary"""
-        # Remove MongoDB's _id field if present
-        data = {k: v for k, v in data.items() if k != '_id'}
+        # Keep only dataclass fields, dropping MongoDB's _id and write-time
+        # bookkeeping such as last_updated or downloaded_date
+        data = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
         
         # Convert ISO string back to datetime
         if isinstance(data.get('scraped_date'), str):
@@ -102,6 +115,8 @@ class MongoDBClient:
         self.client = None
         self.db = None
         self.collection = None
+        # judgment_ids known to be stored, answering existence checks without a query
+        self._seen_ids: Set[str] = set()
         self._connect()
     
     def _connect(self):
@@ -120,6 +135,7 @@ class MongoDBClient:
             
             self.db = self.client[self.config.database_name]
             self.collection = self.db[self.config.collection_name]
+            self.checkpoints = self.db[self.config.checkpoints_collection_name]
             
             # Create indexes
             self._create_indexes()
@@ -154,6 +170,13 @@ class MongoDBClient:
                 ("judgment_date", ASCENDING)
             ])
             
+            # Content-based duplicate lookups (find_existing_content_keys)
+            self.collection.create_index([
+                ("diary_no", ASCENDING),
+                ("case_number", ASCENDING),
+                ("judgment_date", ASCENDING)
+            ])
+            
             self.collection.create_index([
                 ("processing_status", ASCENDING),
                 ("scraped_date", DESCENDING)
@@ -164,6 +187,9 @@ class MongoDBClient:
                 ("search_to_date", ASCENDING)
             ])
             
+            # Date-range checkpoints are keyed by _id; replay them in write order
+            self.checkpoints.create_index("updated_at")
+            
             # Text index for search
             self.collection.create_index([
                 ("title", "text"),
@@ -176,21 +202,134 @@ class MongoDBClient:
             
         except Exception as e:
             logger.warning(f"Failed to create some indexes: {e}")
+        
+        try:
+            # One judgment per (diary_number, case_number, judgment_date); legacy
+            # records without a diary_number are left out of the constraint
+            self.collection.create_index(
+                [
+                    ("diary_number", ASCENDING),
+                    ("case_number", ASCENDING),
+                    ("judgment_date", ASCENDING)
+                ],
+                unique=True,
+                name="dup_key",
+                partialFilterExpression={"diary_number": {"$type": "string"}}
+            )
+        except Exception as e:
+            # Fails while the collection still holds content duplicates
+            logger.warning(f"Failed to create unique content index: {e}")
+    
+    def preload_seen_ids(self, limit: int):
+        """Load up to limit stored judgment_ids into the seen set (for clients that write)"""
+        if limit <= 0:
+            return
+        
+        try:
+            cursor = self.collection.find({}, {"judgment_id": 1, "_id": 0}).limit(limit)
+            self._seen_ids.update(doc["judgment_id"] for doc in cursor if "judgment_id" in doc)
+            logger.info(f"Preloaded {len(self._seen_ids)} judgment IDs for duplicate checks")
+        except Exception as e:
+            logger.warning(f"Failed to preload judgment IDs: {e}")
     
     def insert_judgment(self, judgment: JudgmentMetadata) -> bool:
         """Insert a new judgment record"""
+        if judgment.judgment_id in self._seen_ids:
+            logger.debug(f"Judgment already stored, skipping insert: {judgment.judgment_id}")
+            return False
+        
         try:
             result = self.collection.insert_one(judgment.to_dict())
+            self._seen_ids.add(judgment.judgment_id)
             logger.info(f"Inserted judgment: {judgment.judgment_id}")
             return True
             
         except DuplicateKeyError:
+            self._seen_ids.add(judgment.judgment_id)
             logger.warning(f"Judgment already exists: {judgment.judgment_id}")
             return False
         except Exception as e:
             logger.error(f"Failed to insert judgment {judgment.judgment_id}: {e}")
             return False
     
+    def insert_judgments(self, judgments: List[JudgmentMetadata]) -> int:
+        """Insert many judgment records in unordered batches, returning how many were inserted"""
+        if not judgments:
+            return 0
+        
+        inserted = 0
+        for start in range(0, len(judgments), _INSERT_BATCH_SIZE):
+            batch = judgments[start:start + _INSERT_BATCH_SIZE]
+            try:
+                result = self.collection.insert_many(
+                    [judgment.to_dict() for judgment in batch],
+                    ordered=False
+                )
+                inserted += len(result.inserted_ids)
+                self._seen_ids.update(judgment.judgment_id for judgment in batch)
+                
+            except BulkWriteError as e:
+                # Unordered writes keep going past individual failures; the unique
+                # judgment_id index rejects anything the caller's checks missed
+                write_errors = e.details.get('writeErrors', [])
+                duplicates = sum(1 for error in write_errors if error.get('code') == 11000)
+                failed = {error.get('index') for error in write_errors if error.get('code') != 11000}
+                self._seen_ids.update(
+                    judgment.judgment_id for index, judgment in enumerate(batch) if index not in failed
+                )
+                inserted += e.details.get('nInserted', 0)
+                if duplicates:
+                    logger.info(f"Bulk insert skipped {duplicates} duplicate judgments")
+                if len(write_errors) > duplicates:
+                    logger.warning(f"Bulk insert had {len(write_errors) - duplicates} non-duplicate errors")
+            except Exception as e:
+                logger.error(f"Failed to insert judgments: {e}")
+        
+        logger.info(f"Inserted {inserted} judgments")
+        return inserted
+    
+    def bulk_upsert(self, judgments: List[JudgmentMetadata]) -> int:
+        """Upsert many judgment records by judgment_id in one write, returning how many were new"""
+        if not judgments:
+            return 0
+        
+        try:
+            now = datetime.utcnow().isoformat()
+            operations = []
+            for judgment in judgments:
+                doc = judgment.to_dict()
+                status = doc.pop('processing_status')
+                operations.append(UpdateOne(
+                    {"judgment_id": judgment.judgment_id},
+                    {
+                        "$setOnInsert": doc,
+                        "$set": {"processing_status": status, "last_updated": now}
+                    },
+                    upsert=True
+                ))
+            
+            result = self.collection.bulk_write(operations, ordered=False)
+            self._seen_ids.update(judgment.judgment_id for judgment in judgments)
+            logger.info(f"Upserted {len(judgments)} judgments ({result.upserted_count} new)")
+            return result.upserted_count
+            
+        except BulkWriteError as e:
+            # Concurrent upserts on the same judgment_id can race on the unique index;
+            # those (and every operation without an error) are stored
+            failed = {
+                error.get('index') for error in e.details.get('writeErrors', [])
+                if error.get('code') != 11000
+            }
+            self._seen_ids.update(
+                judgment.judgment_id for index, judgment in enumerate(judgments) if index not in failed
+            )
+            upserted = e.details.get('nUpserted', 0)
+            logger.warning(f"Bulk upsert finished with {len(e.details.get('writeErrors', []))} errors, {upserted} new judgments")
+            return upserted
+        except Exception as e:
+            logger.error(f"Failed to upsert judgments: {e}")
+            return 0
+    
     def update_judgment(self, judgment_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing judgment record"""
         try:
@@ -329,8 +468,46 @@ class MongoDBClient:
         }
         return self.update_judgment(judgment_id, updates)
     
+    def mark_many_as_failed(self, failures: List[Tuple[str, str]]) -> int:
+        """Mark many (judgment_id, error_message) pairs as failed in one write"""
+        if not failures:
+            return 0
+        
+        try:
+            now = datetime.utcnow().isoformat()
+            operations = [
+                UpdateOne(
+                    {"judgment_id": judgment_id},
+                    {
+                        "$set": {
+                            "processing_status": "failed",
+                            "error_message": error_message,
+                            "failed_date": now,
+                            "last_updated": now
+                        },
+                        "$inc": {"retry_count": 1}
+                    }
+                )
+                for judgment_id, error_message in failures
+            ]
+            
+            result = self.collection.bulk_write(operations, ordered=False)
+            logger.info(f"Marked {result.modified_count} judgments as failed")
+            return result.modified_count
+            
+        except Exception as e:
+            logger.error(f"Failed to mark judgments as failed: {e}")
+            return 0
+    
+    def known_ids(self, judgment_ids: List[str]) -> Set[str]:
+        """Return the judgment IDs this client has seen written or found stored, without querying"""
+        return {judgment_id for judgment_id in judgment_ids if judgment_id in self._seen_ids}
+    
     def judgment_exists(self, judgment_id: str) -> bool:
         """Check if judgment already exists in database"""
+        if judgment_id in self._seen_ids:
+            return True
+        
         try:
             return self.collection.count_documents({"judgment_id": judgment_id}) > 0
         except Exception as e:
@@ -354,6 +531,85 @@ class MongoDBClient:
             logger.error(f"Error finding duplicate judgment: {e}")
             return None
     
+    def find_existing_ids(self, judgment_ids: List[str]) -> Set[str]:
+        """Return the subset of judgment IDs that already exist, querying only IDs not already known"""
+        known = self.known_ids(judgment_ids)
+        unknown = [judgment_id for judgment_id in judgment_ids if judgment_id not in known]
+        if not unknown:
+            return known
+        
+        try:
+            cursor = self.collection.find(
+                {"judgment_id": {"$in": unknown}},
+                {"judgment_id": 1, "_id": 0}
+            )
+            found = {doc["judgment_id"] for doc in cursor}
+            self._seen_ids.update(found)
+            return known | found
+        except Exception as e:
+            logger.error(f"Error checking existing judgment IDs: {e}")
+            return known
+    
+    def find_existing_content_keys(self, content_keys: List[Tuple[str, str, str]]) -> Set[Tuple[str, str, str]]:
+        """Return the (diary_no, case_number, judgment_date) keys that already exist, in one query"""
+        if not content_keys:
+            return set()
+        
+        try:
+            diary_nos, case_numbers, judgment_dates = (list(set(values)) for values in zip(*content_keys))
+            cursor = self.collection.find(
+                {
+                    "diary_no": {"$in": diary_nos},
+                    "case_number": {"$in": case_numbers},
+                    "judgment_date": {"$in": judgment_dates}
+                },
+                {"diary_no": 1, "case_number": 1, "judgment_date": 1, "_id": 0}
+            )
+            found = {(doc.get("diary_no"), doc.get("case_number"), doc.get("judgment_date")) for doc in cursor}
+            return found & set(content_keys)
+        except Exception as e:
+            logger.error(f"Error finding duplicate judgments: {e}")
+            return set()
+    
+    def save_checkpoints(self, checkpoints: List[Dict[str, Any]]) -> int:
+        """Upsert date-range checkpoint documents (each carrying its _id) in one write"""
+        if not checkpoints:
+            return 0
+        
+        try:
+            now = datetime.utcnow().isoformat()
+            operations = [
+                UpdateOne(
+                    {"_id": checkpoint["_id"]},
+                    {"$set": {**{k: v for k, v in checkpoint.items() if k != "_id"}, "updated_at": now}},
+                    upsert=True
+                )
+                for checkpoint in checkpoints
+            ]
+            
+            result = self.checkpoints.bulk_write(operations, ordered=False)
+            return result.upserted_count + result.matched_count
+            
+        except Exception as e:
+            logger.error(f"Failed to save date range checkpoints: {e}")
+            return 0
+    
+    def load_checkpoints(self) -> List[Dict[str, Any]]:
+        """Get all date-range checkpoints, oldest write first"""
+        try:
+            return list(self.checkpoints.find({}).sort("updated_at", ASCENDING))
+        except Exception as e:
+            logger.error(f"Failed to load date range checkpoints: {e}")
+            return []
+    
+    def clear_checkpoints(self) -> int:
+        """Delete all date-range checkpoints"""
+        try:
+            return self.checkpoints.delete_many({}).deleted_count
+        except Exception as e:
+            logger.error(f"Failed to clear date range checkpoints: {e}")
+            return 0
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get processing statistics"""
         try:
@@ -428,6 +684,9 @@ class MongoDBClient:
                 "retry_count": {"$gte": max_retries}
             })
             
+            if result.deleted_count:
+                # Deleted IDs may be scraped again; forget them along with the rest
+                self._seen_ids.clear()
             logger.info(f"Cleaned up {result.deleted_count} failed records")
             return result.deleted_count
             
@@ -441,6 +700,21 @@ class MongoDBClient:
             self.client.close()
             logger.info("MongoDB connection closed")
 
+# Process-wide client handed out by get_shared_client (closed at interpreter exit)
+_shared_client: Optional[MongoDBClient] = None
+_shared_client_lock = threading.Lock()
+
+def get_shared_client(config: MongoConfig) -> MongoDBClient:
+    """Return the process-wide MongoDBClient, connecting on first use"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                client = MongoDBClient(config)
+                atexit.register(client.close)
+                _shared_client = client
+    return _shared_client
+
 # Example usage
 if __name__ == "__main__":
     from config import config
@@ -1,6 +1,7 @@
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError, PartialCredentialsError
 from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple, List
@@ -11,6 +12,15 @@ from config import S3Config
 import hashlib
 from tqdm import tqdm
 
+# Managed transfer settings for every upload: 64 MiB parts, 16 threads.
+# upload_fileobj callers must pass a binary handle supporting read(chunksize).
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True
+)
+
 class S3Client:
     """AWS S3 client for uploading Supreme Court judgment files"""
     
@@ -213,6 +223,66 @@ class S3Client:
             logger.error(f"Failed to upload file {file_path}: {e}")
             return None
     
+    def upload_fileobj(self,
+                       fileobj,
+                       file_name: str,
+                       judgment_date: str = None,
+                       case_number: str = None,
+                       metadata: Dict[str, str] = None) -> Optional[Dict[str, Any]]:
+        """Upload an in-memory file (e.g. a BytesIO of a streamed download) to S3"""
+        try:
+            # Ensure bucket exists
+            if not self._ensure_bucket_exists():
+                return None
+            
+            # Generate S3 key
+            s3_key = self._generate_s3_key(file_name, judgment_date, case_number)
+            
+            # Check if file already exists
+            if self._file_exists(s3_key):
+                logger.warning(f"File already exists in S3: {s3_key}")
+                return self._get_file_info(s3_key)
+            
+            data = fileobj.getbuffer()
+            content_type, _ = mimetypes.guess_type(file_name)
+            
+            # Prepare upload metadata
+            upload_metadata = {
+                'uploaded_by': 'supreme_court_scraper',
+                'upload_date': datetime.utcnow().isoformat(),
+                'original_filename': file_name,
+                'file_hash': hashlib.md5(data).hexdigest(),
+                'file_size': str(data.nbytes)
+            }
+            del data  # Release the buffer export so the BytesIO can be read
+            
+            if judgment_date:
+                upload_metadata['judgment_date'] = judgment_date
+            if case_number:
+                upload_metadata['case_number'] = case_number
+            if metadata:
+                upload_metadata.update(metadata)
+            
+            logger.info(f"Uploading {file_name} to S3: {s3_key}")
+            fileobj.seek(0)
+            self.s3_client.upload_fileobj(
+                fileobj,
+                self.config.bucket_name,
+                s3_key,
+                ExtraArgs={
+                    'ContentType': content_type or 'application/octet-stream',
+                    'Metadata': upload_metadata
+                },
+                Config=_TRANSFER_CONFIG
+            )
+            
+            logger.info(f"Successfully uploaded: {s3_key}")
+            return self._get_file_info(s3_key)
+            
+        except Exception as e:
+            logger.error(f"Failed to upload {file_name}: {e}")
+            return None
+    
     def _upload_small_file(self, file_path: Path, s3_key: str, metadata: Dict[str, str], file_metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Upload small file in single request"""
         try:
@@ -224,7 +294,8 @@ class S3Client:
                     ExtraArgs={
                         'ContentType': file_metadata['content_type'],
                         'Metadata': metadata
-                    }
+                    },
+                    Config=_TRANSFER_CONFIG
                 )
             
             logger.info(f"Successfully uploaded: {s3_key}")
@@ -244,14 +315,6 @@ class S3Client:
                 percentage = (bytes_transferred / file_size) * 100
                 logger.info(f"Upload progress: {percentage:.1f}% ({bytes_transferred}/{file_size} bytes)")
             
-            # Configure transfer
-            transfer_config = boto3.s3.transfer.TransferConfig(
-                multipart_threshold=1024 * 25,  # 25MB
-                max_concurrency=10,
-                multipart_chunksize=1024 * 25,
-                use_threads=True
-            )
-            
             # Upload with progress tracking
             self.s3_client.upload_file(
                 str(file_path),
@@ -261,7 +324,7 @@ class S3Client:
                     'ContentType': file_metadata['content_type'],
                     'Metadata': metadata
                 },
-                Config=transfer_config,
+                Config=_TRANSFER_CONFIG,
                 Callback=progress_callback
             )
             
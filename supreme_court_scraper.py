@@ -1,13 +1,24 @@
 from playwright.sync_api import sync_playwright, Page, Browser
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 import requests
+import httpx
+import asyncio
+from requests.adapters import HTTPAdapter
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from collections import OrderedDict, deque
 import time
+import sys
 import os
+import io
+import re
+import html
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime
-import json
-from urllib.parse import urljoin, urlparse
+from typing import Callable, List, Dict, Iterator, Optional, Tuple
+from datetime import datetime, timedelta
+import orjson
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -15,19 +26,154 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from config import AppConfig
 from date_manager import DateManager, DateRange
 from captcha_solver import CaptchaSolver
-from mongodb_client import MongoDBClient, JudgmentMetadata
+from mongodb_client import MongoDBClient, JudgmentMetadata, make_judgment_id
 from s3_client import S3Client
 
+# Analytics/tracker hosts whose requests never carry judgment data
+_TRACKER_URL_RE = re.compile(r"google-analytics\.com|googletagmanager|doubleclick|facebook\.net|hotjar")
+
+# Judgment date as printed in the results table (DD-MM-YYYY)
+_DATE_RE = re.compile(r'(\d{2}-\d{2}-\d{4})')
+# Looser date (dd-mm-yyyy or dd/mm/yyyy) for free-form row text
+_DATE_LOOSE_RE = re.compile(r'(\d{1,2}[-/]\d{1,2}[-/]\d{4})')
+# PDF URL embedded in an onclick handler
+_ONCLICK_URL_RE = re.compile(r"""['"]([^'"]*\.pdf[^'"]*)['"]|window\.open\(['"]([^'"]*)['"]""")
+
+# Supreme Court results table structure (8 columns); each of the first seven
+# columns fills its canonical field plus any legacy alias:
+#   1 Serial Number, 2 Diary Number, 3 Case Number, 4 Petitioner/Respondent,
+#   5 Petitioner/Respondent Advocate, 6 Bench, 7 Judgment By,
+#   8 Judgment (contains date and PDF links)
+_SC_COLUMNS = (
+    ('serial_number', 'serial_no'),             # serial_no is a legacy field
+    ('diary_number', 'diary_no'),               # diary_no is a legacy field
+    ('case_number',),
+    ('petitioner_respondent', 'title'),         # title is a legacy field
+    ('advocate',),
+    ('bench',),
+    ('judgment_by', 'judge')                    # judge is a legacy field
+)
+
+# Words that suggest a captured response carries judgment data; only the
+# head of each body is scanned
+_INDICATORS = ('judgment', 'case', 'petitioner', 'respondent', 'diary', 'pdf')
+_INDICATOR_RE = re.compile('|'.join(_INDICATORS), re.IGNORECASE)
+_INDICATOR_SCAN_LIMIT = 65536
+
+# AJAX action behind the judgment-date search; concurrent mode replays it
+_RESULTS_API_ACTION = 'get_judgements_judgement_date'
+
+# Outcomes of the previous date range that call for the full retry_delay before the next one
+_BACKOFF_STATUSES = ("captcha_fail", "http_429", "http_5xx")
+
+# Seconds to pause between date ranges when the server is responding normally
+_HEALTHY_RANGE_DELAY = 0.1
+
+# Fallback cap on network responses held in memory for a single date range
+_MAX_CAPTURED_RESPONSES = 10000
+
+# Max captured response bodies whose parse results are kept for reuse
+_PARSED_BODY_CACHE_SIZE = 256
+
+# Max judgments remembered by the in-process duplicate cache
+_SEEN_CACHE_SIZE = 50000
+
+# Body that starts like a JSON document
+_JSON_START_RE = re.compile(r'\s*[\[{]')
+
+# Table markup, raw and as it appears percent-encoded in a query string
+_TABLE_MARKER_RE = re.compile(r'<t(?:able|r)', re.IGNORECASE)
+_ENCODED_TABLE_MARKER_RE = re.compile(r'(?:<|%(?:25)?3C)t(?:able|r)', re.IGNORECASE)
+
+# JSON source key -> (judgment field, priority) for _extract_judgment_from_json_item
+_JSON_KEY_TO_FIELD = {
+    key: (field, rank)
+    for field, keys in {
+        'serial_no': ('serial', 'sno', 'id', 'index'),
+        'diary_no': ('diary', 'diary_no', 'diary_number'),
+        'case_number': ('case', 'case_no', 'case_number', 'caseNumber'),
+        'petitioner_respondent': ('parties', 'petitioner', 'respondent', 'case_title'),
+        'advocate': ('advocate', 'lawyer', 'counsel'),
+        'judgment_date': ('date', 'judgment_date', 'judgmentDate', 'decided_on'),
+        'pdf_link': ('link', 'url', 'pdf', 'download', 'file_url'),
+    }.items()
+    for rank, key in enumerate(keys)
+}
+
+# Tag stripping and whitespace collapsing for _clean_html_content
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Common case number patterns, tried in order
+_CASE_NUMBER_RES = (
+    re.compile(r'(\d+/\d+)', re.IGNORECASE),
+    re.compile(r'([A-Z]+\s*\d+\s*/\s*\d+)', re.IGNORECASE),
+    re.compile(r'(Case\s*No[.:]*\s*[^\s]+)', re.IGNORECASE)
+)
+
+# Returns [{cells: [text, ...], links: [[[href, text], ...], ...]}, ...] for the
+# first results table, or null when the page has no table
+_RESULT_ROWS_JS = """
+() => {
+    const table = document.querySelector('table');
+    if (!table) return null;
+    return Array.from(table.querySelectorAll('tbody tr')).map(tr => {
+        const cells = Array.from(tr.cells).filter(c => c.tagName === 'TD');
+        return {
+            cells: cells.map(c => c.innerText.trim()),
+            links: cells.map(c => Array.from(c.querySelectorAll('a[href]'))
+                .map(a => [a.getAttribute('href'), a.innerText.trim()]))
+        };
+    });
+}
+"""
+
+# Markers of a judgment PDF/download link in an href or onclick handler
+# (plain substring tests on the lowercased value; much cheaper than a
+# case-insensitive alternation on these short strings)
+def _is_pdf_href(href: str) -> bool:
+    href = href.lower()
+    return '.pdf' in href or 'download' in href or 'judgment' in href
+
+def _is_pdf_onclick(onclick: str) -> bool:
+    onclick = onclick.lower()
+    return 'pdf' in onclick or 'download' in onclick
+
+def _anchor_attrs(attrs) -> Tuple[str, str]:
+    """(href, onclick) from an anchor's attribute mapping, read once per anchor"""
+    return attrs.get('href') or '', attrs.get('onclick') or ''
+
+def _build_row_extractor(columns) -> Callable[[List[str]], Dict[str, str]]:
+    """Generate a function mapping a full row of cell texts onto its column fields"""
+    fields = ", ".join(f"{key!r}: texts[{i}]" for i, keys in enumerate(columns) for key in keys)
+    namespace = {}
+    exec(f"def _extract_row(texts):\n    return {{{fields}}}\n", namespace)
+    return namespace['_extract_row']
+
+# Row builder specialised to _SC_COLUMNS: one dict display with unrolled cell
+# indexing instead of the per-column loop (rows shorter than the schema still loop)
+_extract_row = _build_row_extractor(_SC_COLUMNS)
+
 class SupremeCourtScraper:
     """Main scraper class for Supreme Court judgments"""
     
+    _extract_row = staticmethod(_extract_row)
+    
+    # Indicators that dynamic content has loaded, tried in order
+    _DYNAMIC_CONTENT_WAITS = (
+        # Wait for table to be attached to the DOM
+        lambda page: page.wait_for_selector('table', state='attached', timeout=1500),
+        # Wait for any content in cnrresults
+        lambda page: page.wait_for_selector('#cnrresults table', state='attached', timeout=1500),
+        # Wait for loading indicators to disappear
+        lambda page: page.wait_for_selector('.loading', state='hidden', timeout=5000),
+        # Wait for network idle
+        lambda page: page.wait_for_load_state('networkidle', timeout=10000)
+    )
+    
     def __init__(self, config: AppConfig):
         self.config = config
-        self.date_manager = DateManager(
-            config.scraping.start_year,
-            config.scraping.end_year,
-            config.scraping.max_date_range_days
-        )
+        self._debug = bool(getattr(config, 'debug', False))
         self.captcha_solver = CaptchaSolver(
             config.captcha.use_manual_input,
             config.captcha.ocr_confidence_threshold,
@@ -38,21 +184,47 @@ class SupremeCourtScraper:
             config.captcha.openai_temperature
         )
         self.mongo_client = MongoDBClient(config.mongo)
+        # Only the scraper writes judgments, so only its client warms the duplicate cache
+        self.mongo_client.preload_seen_ids(config.scraping.seen_preload_limit)
         self.s3_client = S3Client(config.s3)
+        self.date_manager = DateManager(
+            config.scraping.start_year,
+            config.scraping.end_year,
+            config.scraping.max_date_range_days,
+            checkpoint_store=self.mongo_client
+        )
         
         # Playwright objects
         self.playwright = None
         self.browser = None
         self.page = None
         
-        # Network monitoring
-        self.captured_responses = []
+        # Network monitoring; captured responses are bounded and dropped after each date range
+        self.captured_responses = deque(maxlen=config.scraping.max_captured_responses or _MAX_CAPTURED_RESPONSES)
         self.api_endpoints = []
         
+        # Parse results per response-body hash, least recently used evicted first
+        self._parsed_bodies = OrderedDict()
+        
+        # (judgment_id, error) pairs waiting to be marked failed in one write
+        self._pending_failures = []
+        
+        # Outcome of the current date range, used to pace the next one
+        self._last_status = "ok"
+        
+        # Judgments already seen this run, trimmed oldest-first
+        self._seen_content_keys = set()
+        self._seen_ids = set()
+        self._seen_order = deque()
+        
         # Download directory
         self.download_dir = Path("downloads")
         self.download_dir.mkdir(exist_ok=True)
         
+        # Pooled keep-alive HTTP session for judgment file downloads
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        
         # Statistics
         self.stats = {
             "total_processed": 0,
@@ -60,8 +232,8 @@ class SupremeCourtScraper:
             "failed_downloads": 0,
             "captcha_failures": 0,
             "upload_failures": 0,
-            "start_time": None,
-            "end_time": None
+            "start_ts": None,
+            "duration_s": None
         }
     
     def setup_browser(self):
@@ -98,6 +270,9 @@ class SupremeCourtScraper:
     def setup_network_monitoring(self):
         """Setup network request/response monitoring"""
         try:
+            # Abort analytics/tracker beacons before they reach the response handler
+            self.page.route(_TRACKER_URL_RE, lambda route: route.abort())
+            
             # Monitor all network requests
             self.page.on("request", self._handle_request)
             self.page.on("response", self._handle_response)
@@ -128,6 +303,12 @@ class SupremeCourtScraper:
             url = response.url
             status = response.status
             
+            # Rate limiting or server errors mean the next range should back off
+            if status == 429:
+                self._last_status = "http_429"
+            elif status >= 500:
+                self._last_status = "http_5xx"
+            
             # Capture responses that might contain judgment data
             if (status == 200 and 
                 any(keyword in url.lower() for keyword in ['api', 'ajax', 'search', 'judgment', 'result'])):
@@ -137,12 +318,12 @@ class SupremeCourtScraper:
                 # Try to get response body for analysis
                 try:
                     # Only capture text responses (not images, etc.)
-                    content_type = response.headers.get('content-type', '')
+                    content_type = response.header_value('content-type') or ''
                     if any(ct in content_type.lower() for ct in ['json', 'html', 'xml', 'text']):
                         response_data = {
                             'url': url,
                             'status': status,
-                            'headers': dict(response.headers),
+                            'content_type': content_type,
                             'timestamp': datetime.now().isoformat()
                         }
                         
@@ -198,6 +379,14 @@ class SupremeCourtScraper:
             logger.error(f"Failed to navigate to search page: {e}")
             raise
     
+    def _on_search_page(self) -> bool:
+        """Check whether the search form is already loaded and can be reused"""
+        try:
+            return ("judgement-date" in self.page.url and
+                    self.page.locator("input[name*='from'], input[id*='from'], input[placeholder*='from']").first.is_visible())
+        except Exception:
+            return False
+    
     def fill_search_form(self, date_range: DateRange) -> bool:
         """Fill the search form with date range"""
         try:
@@ -242,6 +431,7 @@ class SupremeCourtScraper:
             if not captcha_text:
                 logger.error("Failed to solve CAPTCHA")
                 self.stats["captcha_failures"] += 1
+                self._last_status = "captcha_fail"
                 return False
             
             # Enter CAPTCHA text
@@ -310,6 +500,7 @@ class SupremeCourtScraper:
                 
                 if captcha_error_found:
                     logger.warning("CAPTCHA validation failed - specific error message detected")
+                    self._last_status = "captcha_fail"
                     return False
                 
                 # Additional check: if error elements contain CAPTCHA-related errors
@@ -364,65 +555,29 @@ class SupremeCourtScraper:
             # Wait for potential dynamic content loading
             self._wait_for_dynamic_content()
             
-            # Parse page content with BeautifulSoup
-            soup = BeautifulSoup(self.page.content(), 'html.parser')
-            
-            # Debug: Log page content structure
-            logger.debug(f"Page content length: {len(self.page.content())}")
-            
-            # Look for the results table structure
-            table = soup.find('table')
-            if not table:
-                logger.warning("No table found in search results")
-                # Try alternative selectors - first check cnrresults div
-                cnr_div = soup.find('div', id='cnrresults')
-                if cnr_div:
-                    table = cnr_div.find('table')
-                    if table:
-                        logger.info("Found table in cnrresults div")
-                    else:
-                        logger.warning("cnrresults div found but no table inside")
-                
-                # If still no table, try distTableContent
-                if not table:
-                    table = soup.find('div', class_='distTableContent')
-                    if table:
-                        table = table.find('table')
-                        logger.info("Found table in distTableContent div")
-                    else:
-                        logger.error("No table found in any expected location")
-                        return []
-            
-            # Find all table rows with judgment data
-            tbody = table.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
-                logger.info(f"Found {len(rows)} rows in tbody")
-            else:
-                all_rows = table.find_all('tr')
-                rows = all_rows[1:] if len(all_rows) > 1 else all_rows  # Skip header if present
-                logger.info(f"Found {len(rows)} rows (skipped header)")
+            # Collect every row's cell text and anchors in one round-trip;
+            # the text normalization runs inside the browser
+            rows = self.page.evaluate(_RESULT_ROWS_JS)
+            if rows is None:
+                logger.error("No table found in search results")
+                return []
+            logger.info(f"Found {len(rows)} rows in results table")
             
             for i, row in enumerate(rows):
                 try:
-                    cells = row.find_all('td')
-                    print(f"DEBUG: Row {i+1}: Found {len(cells)} cells")
+                    cell_texts = row['cells']
+                    print(f"DEBUG: Row {i+1}: Found {len(cell_texts)} cells")
                     
                     # Print cell contents for debugging
-                    for j, cell in enumerate(cells):
-                        print(f"DEBUG: Row {i+1}, Cell {j+1}: '{cell.get_text(strip=True)[:50]}'")
+                    for j, text in enumerate(cell_texts):
+                        print(f"DEBUG: Row {i+1}, Cell {j+1}: '{text[:50]}'")
                     
-                    if len(cells) < 7:  # Minimum expected columns
-                        print(f"DEBUG: Row {i+1}: Skipping row with {len(cells)} cells (expected at least 7)")
+                    if len(cell_texts) < 7:  # Minimum expected columns
+                        print(f"DEBUG: Row {i+1}: Skipping row with {len(cell_texts)} cells (expected at least 7)")
                         continue
                     
                     # Extract data from table cells (adjust for actual structure)
-                    serial_no = cells[0].get_text(strip=True)
-                    diary_no = cells[1].get_text(strip=True)
-                    case_number = cells[2].get_text(strip=True)
-                    petitioner_respondent = cells[3].get_text(strip=True)
-                    advocate = cells[4].get_text(strip=True)
-                    bench = cells[5].get_text(strip=True)
+                    serial_no, diary_no, case_number, petitioner_respondent, advocate, bench = cell_texts[:6]
                     print(serial_no, "serial no")
                     print(diary_no, "diary no")
                     print(case_number, "case number")
@@ -430,23 +585,18 @@ class SupremeCourtScraper:
                     print(advocate, "advocate")
                     print(bench, "bench")
                     # Handle different column structures
-                    if len(cells) >= 8:
-                        judgment_by = cells[6].get_text(strip=True)
-                        judgment_cell = cells[7]
+                    if len(cell_texts) >= 8:
+                        judgment_by = cell_texts[6]
+                        pdf_links = row['links'][7]
                     else:
                         # If only 7 cells, the last cell contains judgment info
-                        judgment_by = cells[5].get_text(strip=True)  # Use bench as judgment_by
-                        judgment_cell = cells[6]
-                    
-                    logger.debug(f"Row {i+1}: Case {case_number}, Diary {diary_no}, Cells: {len(cells)}")
-                    pdf_links = judgment_cell.find_all('a', href=True)
+                        judgment_by = bench  # Use bench as judgment_by
+                        pdf_links = row['links'][6]
                     
+                    logger.debug(f"Row {i+1}: Case {case_number}, Diary {diary_no}, Cells: {len(cell_texts)}")
                     logger.debug(f"Row {i+1}: Found {len(pdf_links)} links in judgment cell")
                     
-                    for j, link in enumerate(pdf_links):
-                        href = link.get('href')
-                        link_text = link.get_text(strip=True)
-                        
+                    for j, (href, link_text) in enumerate(pdf_links):
                         logger.debug(f"Row {i+1}, Link {j+1}: href='{href}', text='{link_text}'")
                         
                         # Filter for valid PDF links (more permissive)
@@ -460,12 +610,9 @@ class SupremeCourtScraper:
                                 logger.debug(f"Row {i+1}, Link {j+1}: Skipping placeholder link")
                                 continue
                             
-                            # Extract judgment date from link text
+                            # Extract judgment date from link text (format: DD-MM-YYYY)
                             judgment_date = ''
-                            
-                            # Try to extract date from link text (format: DD-MM-YYYY)
-                            import re
-                            date_match = re.search(r'(\d{2}-\d{2}-\d{4})', link_text)
+                            date_match = _DATE_RE.search(link_text)
                             if date_match:
                                 judgment_date = date_match.group(1)
                             
@@ -576,15 +723,14 @@ class SupremeCourtScraper:
                     if response.status_code == 200:
                         # Try to parse response
                         try:
-                            json_data = response.json()
+                            json_data = orjson.loads(response.content)
                             parsed_judgments = self._parse_json_for_judgments(json_data)
                             if parsed_judgments:
                                 judgments.extend(parsed_judgments)
                                 break  # Success, no need to try other parameter sets
                         except:
-                            # Try parsing as HTML
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            parsed_judgments = self._parse_table_from_soup(soup)
+                            # Try parsing as HTML; Lexbor takes the raw text directly
+                            parsed_judgments = self._parse_table_from_soup(response.text)
                             if parsed_judgments:
                                 judgments.extend(parsed_judgments)
                                 break
@@ -605,77 +751,113 @@ class SupremeCourtScraper:
 
         try:
             for response_data in self.captured_responses:
+                # Already-decoded JSON payloads skip the body checks and json parse
+                parsed = response_data.get('parsed')
+                if parsed is not None:
+                    judgments.extend(self._parse_json_for_judgments(parsed))
+                    continue
+                
                 if 'body' in response_data:
                     body = response_data['body']
+                    if isinstance(body, bytes):
+                        body = body.decode('utf-8', errors='ignore')
                     url = response_data.get('url', '')
                     
-                    # Target the specific Google Analytics API call that contains judgment data
-                    is_target_api = ('google-analytics.com/g/collect' in url and 
-                                   'en=user_engagement' in url and 
-                                   len(body) > 1000)  # Has substantial content
-                    
-                    # Also process other known judgment APIs
+                    # Only known judgment APIs carry results; other large bodies are page assets
                     is_judgment_api = ('admin-ajax.php' in url or 
                                      'action=get_judgements' in url or
                                      'judgement_date' in url)
                     
-                    if is_target_api or is_judgment_api or len(body) > 10000:
-                        logger.info(f"Processing API response from {url} ({len(body)} bytes)")
-                        
-                        # For Google Analytics API, extract embedded judgment data
-                        if is_target_api:
-                            extracted = self._parse_google_analytics_response(body, url)
-                            if extracted:
-                                judgments.extend(extracted)
-                                logger.info(f"Extracted {len(extracted)} judgments from Google Analytics API")
-                                # Save directly to MongoDB without S3 upload
-                                self._save_judgments_to_mongodb(extracted)
-                                continue
-                        
-                        # Try to parse as JSON first
-                        try:
-                            import json
-                            json_data = json.loads(body)
-                            
-                            # Look for judgment data in JSON response
-                            extracted = self._parse_json_for_judgments(json_data)
-                            if extracted:
-                                judgments.extend(extracted)
-                                logger.info(f"Extracted {len(extracted)} judgments from JSON response")
-                                continue
-                                
-                        except json.JSONDecodeError:
-                            pass
+                    if not is_judgment_api:
+                        continue
+                    
+                    # Cheap content checks before any JSON or HTML parse
+                    if ('resultsHtml' not in body and not _JSON_START_RE.match(body)
+                            and not _TABLE_MARKER_RE.search(body)):
+                        logger.debug(f"Skipping response without judgment markup from {url}")
+                        continue
+                    
+                    logger.info(f"Processing API response from {url} ({len(body)} bytes)")
+                    
+                    # Parsing is deterministic in the body, so reuse earlier results
+                    extracted = self._cached_parse(hash(body), lambda: self._parse_response_body(body))
+                    
+                    # Hand out copies so callers can't mutate cached entries
+                    judgments.extend(dict(judgment) for judgment in extracted)
                         
-                        # Parse as HTML with enhanced detection
-                        try:
-                            soup = BeautifulSoup(body, 'html.parser')
-                            
-                            # Look for tables with judgment data
-                            tables = soup.find_all('table')
-                            logger.info(f"Found {len(tables)} tables in response")
-                            
-                            for table in tables:
-                                rows = table.find_all('tr')
-                                logger.info(f"Table has {len(rows)} rows")
-                                
-                                # Process table regardless of row count
-                                extracted = self._parse_table_from_soup(soup)
-                                if extracted:
-                                    judgments.extend(extracted)
-                                    logger.info(f"Extracted {len(extracted)} judgments from table")
-                                    break  # Found data, no need to check other tables
-                                else:
-                                    logger.debug(f"No judgments extracted from table with {len(rows)} rows")
-                                        
-                        except Exception as e:
-                            logger.debug(f"Error parsing HTML response: {e}")
-                            
         except Exception as e:
             logger.error(f"Error extracting from network responses: {e}")
             
         return judgments
     
+    def _cached_parse(self, key, parse) -> Tuple[Dict[str, str], ...]:
+        """Return cached judgments for key, calling parse() and caching its result on a miss"""
+        extracted = self._parsed_bodies.get(key)
+        if extracted is None:
+            extracted = tuple(parse())
+            self._parsed_bodies[key] = extracted
+            if len(self._parsed_bodies) > _PARSED_BODY_CACHE_SIZE:
+                self._parsed_bodies.popitem(last=False)
+        else:
+            self._parsed_bodies.move_to_end(key)
+            logger.debug(f"Reusing {len(extracted)} judgments parsed earlier from this body")
+        return extracted
+    
+    def _results_response_captured(self, since: int = 0) -> bool:
+        """Check whether the results API accepted a search among responses captured after index since"""
+        for response_data in islice(self.captured_responses, since, None):
+            if _RESULTS_API_ACTION not in response_data.get('url', ''):
+                continue
+            data = response_data.get('parsed')
+            if data is None:
+                if 'body' not in response_data:
+                    continue
+                try:
+                    data = orjson.loads(response_data['body'])
+                except orjson.JSONDecodeError:
+                    continue
+            # A rejected CAPTCHA token comes back as success: false
+            if isinstance(data, dict) and data.get('success'):
+                return True
+        return False
+    
+    def _parse_response_body(self, body: str) -> List[Dict[str, str]]:
+        """Parse one captured response body as JSON, falling back to HTML"""
+        # Try to parse as JSON first
+        try:
+            json_data = orjson.loads(body)
+            
+            # Look for judgment data in JSON response
+            extracted = self._parse_json_for_judgments(json_data)
+            if extracted:
+                logger.info(f"Extracted {len(extracted)} judgments from JSON response")
+                return extracted
+                
+        except orjson.JSONDecodeError:
+            pass
+        
+        # Parse as HTML once; only the first table holds results
+        try:
+            tree = LexborHTMLParser(body)
+            tables = tree.css('table')
+            logger.info(f"Found {len(tables)} tables in response")
+            
+            if tables:
+                row_count = len(tables[0].css('tr'))
+                logger.info(f"Table has {row_count} rows")
+                
+                # Process table regardless of row count
+                extracted = self._parse_table_from_soup(tree)
+                if extracted:
+                    logger.info(f"Extracted {len(extracted)} judgments from table")
+                    return extracted
+                logger.debug(f"No judgments extracted from table with {row_count} rows")
+                    
+        except Exception as e:
+            logger.debug(f"Error parsing HTML response: {e}")
+        
+        return []
+    
     def _parse_json_for_judgments(self, json_data) -> List[Dict[str, str]]:
         """Parse JSON data for judgment information"""
         judgments = []
@@ -687,12 +869,11 @@ class SupremeCourtScraper:
                 if 'data' in json_data and isinstance(json_data['data'], dict):
                     data = json_data['data']
                     if 'resultsHtml' in data:
-                        # Parse the HTML content within the JSON
+                        # Parse the HTML content within the JSON directly with Lexbor
                         html_content = data['resultsHtml']
                         logger.info(f"Found resultsHtml with {len(html_content)} characters")
                         
-                        soup = BeautifulSoup(html_content, 'html.parser')
-                        table_judgments = self._parse_table_from_soup(soup)
+                        table_judgments = self._parse_table_from_soup(html_content)
                         if table_judgments:
                             judgments.extend(table_judgments)
                             logger.info(f"Extracted {len(table_judgments)} judgments from resultsHtml")
@@ -725,22 +906,17 @@ class SupremeCourtScraper:
         try:
             judgment = {}
             
-            # Map common JSON keys to our judgment fields
-            key_mappings = {
-                'serial_no': ['serial', 'sno', 'id', 'index'],
-                'diary_no': ['diary', 'diary_no', 'diary_number'],
-                'case_number': ['case', 'case_no', 'case_number', 'caseNumber'],
-                'petitioner_respondent': ['parties', 'petitioner', 'respondent', 'case_title'],
-                'advocate': ['advocate', 'lawyer', 'counsel'],
-                'judgment_date': ['date', 'judgment_date', 'judgmentDate', 'decided_on'],
-                'pdf_link': ['link', 'url', 'pdf', 'download', 'file_url']
-            }
-            
-            for field, possible_keys in key_mappings.items():
-                for key in possible_keys:
-                    if key in item and item[key]:
-                        judgment[field] = str(item[key]).strip()
-                        break
+            # Single pass over the item; when several source keys map to the
+            # same field, the lower-ranked (earlier-listed) key wins
+            ranks = {}
+            for key, value in item.items():
+                mapping = _JSON_KEY_TO_FIELD.get(key)
+                if mapping is None or not value:
+                    continue
+                field, rank = mapping
+                if rank < ranks.get(field, len(_JSON_KEY_TO_FIELD)):
+                    ranks[field] = rank
+                    judgment[field] = str(value).strip()
             
             # Only return if we have essential fields
             if judgment.get('case_number') or judgment.get('pdf_link'):
@@ -751,166 +927,165 @@ class SupremeCourtScraper:
             
         return None
     
-    def _parse_table_from_soup(self, soup) -> List[Dict[str, str]]:
-        """Parse table data from BeautifulSoup object"""
+    def _iter_table_rows(self, source) -> Iterator[Tuple[List[str], List[List[Tuple[str, str]]]]]:
+        """Yield the rows of the first table in raw HTML (or a Lexbor tree) one at a
+        time as (cell texts, per-cell list of (href, onclick) anchor pairs)"""
+        tree = source if isinstance(source, LexborHTMLParser) else LexborHTMLParser(source)
+        
+        table = tree.css_first('table')
+        if table is None:
+            logger.debug("No table found in HTML")
+            return
+        
+        # Walk table > tbody > tr > td as direct children instead of running CSS
+        # selectors per row; Lexbor wraps bare rows in an implicit tbody
+        rows = [
+            row for section in table.iter() if section.tag == 'tbody'
+            for row in section.iter() if row.tag == 'tr'
+        ]
+        if rows:
+            logger.debug(f"Found {len(rows)} rows in tbody")
+        else:
+            all_rows = table.css('tr')
+            rows = all_rows[1:] if len(all_rows) > 1 else all_rows  # Skip header if present
+            logger.debug(f"Found {len(rows)} data rows (skipped header)")
+        
+        for row in rows:
+            cells = [cell for cell in row.iter() if cell.tag == 'td']
+            texts = [cell.text(strip=True) for cell in cells]
+            
+            # One anchor query per row, each anchor filed under its enclosing cell
+            anchors = [[] for _ in cells]
+            cell_index = {cell.mem_id: i for i, cell in enumerate(cells)}
+            for a in row.css('td a'):
+                parent = a.parent
+                while parent is not None and parent.tag != 'td':
+                    parent = parent.parent
+                i = cell_index.get(parent.mem_id) if parent is not None else None
+                if i is not None:
+                    anchors[i].append(_anchor_attrs(a.attributes))
+            
+            yield texts, anchors
+    
+    def _parse_table_from_soup(self, source) -> List[Dict[str, str]]:
+        """Parse table data from raw HTML, a Lexbor tree or a BeautifulSoup object"""
         judgments = []
         
         try:
-            table = soup.find('table')
-            if not table:
-                logger.debug("No table found in soup")
+            if not isinstance(source, (str, LexborHTMLParser)):
+                # Legacy BeautifulSoup callers: hand the markup to Lexbor
+                source = str(source)
+            
+            # Skip the parse entirely for blobs with no table markup
+            if isinstance(source, str) and not _TABLE_MARKER_RE.search(source):
+                logger.debug("No table markup in HTML")
                 return judgments
-                
-            # Find all table rows
-            tbody = table.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
-                logger.debug(f"Found {len(rows)} rows in tbody")
-            else:
-                all_rows = table.find_all('tr')
-                rows = all_rows[1:] if len(all_rows) > 1 else all_rows  # Skip header if present
-                logger.debug(f"Found {len(rows)} data rows (skipped header)")
             
-            for i, row in enumerate(rows):
-                cells = row.find_all('td')
-                logger.debug(f"Row {i+1}: Found {len(cells)} cells")
+            for i, (texts, anchors) in enumerate(self._iter_table_rows(source)):
+                logger.debug(f"Row {i+1}: Found {len(texts)} cells")
                 
                 # Be more flexible with cell count - require at least 3 cells
-                if len(cells) >= 3:
-                    judgment = self._extract_judgment_from_cells(cells)
+                if len(texts) >= 3:
+                    judgment = self._extract_judgment_from_text_cells(texts, anchors)
                     if judgment:
                         judgments.append(judgment)
                         logger.debug(f"Successfully extracted judgment from row {i+1}")
                 else:
-                    logger.debug(f"Row {i+1}: Not enough cells ({len(cells)} < 3)")
+                    logger.debug(f"Row {i+1}: Not enough cells ({len(texts)} < 3)")
                         
         except Exception as e:
-            logger.debug(f"Error parsing table from soup: {e}")
+            logger.debug(f"Error parsing table: {e}")
             
         return judgments
     
-    def _extract_judgment_from_cells(self, cells) -> Optional[Dict[str, str]]:
-        """Extract judgment data from table cells"""
+    @staticmethod
+    def _extract_judgment_from_cells(cells) -> Optional[Dict[str, str]]:
+        """Extract judgment data from Lexbor (or legacy BeautifulSoup) table cells"""
+        if cells and isinstance(cells[0], LexborNode):
+            texts = [cell.text(strip=True) for cell in cells]
+            # Lexbor serializes tag names in lowercase, so a substring test on the
+            # cell markup skips the selector query for the anchor-free columns
+            anchors = [
+                [_anchor_attrs(a.attributes) for a in cell.css('a')] if '<a' in cell.html else []
+                for cell in cells
+            ]
+            return SupremeCourtScraper._extract_judgment_from_text_cells(texts, anchors)
+        
+        texts = [cell.get_text(strip=True) for cell in cells]
+        anchors = [
+            [_anchor_attrs(link.attrs) for link in cell.find_all('a')]
+            for cell in cells
+        ]
+        return SupremeCourtScraper._extract_judgment_from_text_cells(texts, anchors)
+    
+    @staticmethod
+    def _extract_judgment_from_text_cells(texts: List[str], anchors: List[List[Tuple[str, str]]]) -> Optional[Dict[str, str]]:
+        """Extract judgment data from cell texts and their (href, onclick) anchors"""
         try:
-            # Initialize judgment with available data
-            judgment = {}
+            # Columns 1-7 map straight onto fields; column 8 (judgment date
+            # and PDF links) is handled below
+            if len(texts) >= len(_SC_COLUMNS):
+                judgment = _extract_row(texts)
+            else:
+                judgment = {}
+                for text, keys in zip(texts, _SC_COLUMNS):
+                    for key in keys:
+                        judgment[key] = text
             
-            # Extract text from cells based on Supreme Court table structure (8 columns):
-            # Column 1: Serial Number
-            # Column 2: Diary Number  
-            # Column 3: Case Number
-            # Column 4: Petitioner/Respondent
-            # Column 5: Petitioner/Respondent Advocate
-            # Column 6: Bench
-            # Column 7: Judgment By
-            # Column 8: Judgment (contains date and PDF links)
-            
-            if len(cells) >= 1:
-                judgment['serial_number'] = cells[0].get_text(strip=True)
-                judgment['serial_no'] = cells[0].get_text(strip=True)  # Legacy field
-            if len(cells) >= 2:
-                judgment['diary_number'] = cells[1].get_text(strip=True)
-                judgment['diary_no'] = cells[1].get_text(strip=True)  # Legacy field
-            if len(cells) >= 3:
-                judgment['case_number'] = cells[2].get_text(strip=True)
-            if len(cells) >= 4:
-                judgment['petitioner_respondent'] = cells[3].get_text(strip=True)
-                judgment['title'] = cells[3].get_text(strip=True)  # Legacy field
-            if len(cells) >= 5:
-                judgment['advocate'] = cells[4].get_text(strip=True)
-            if len(cells) >= 6:
-                judgment['bench'] = cells[5].get_text(strip=True)
-            if len(cells) >= 7:
-                judgment['judgment_by'] = cells[6].get_text(strip=True)
-                judgment['judge'] = cells[6].get_text(strip=True)  # Legacy field
-            if len(cells) >= 8:
+            if len(texts) >= 8:
                 # Last column contains judgment date and PDF links
-                judgment_cell = cells[7]
+                judgment_text = texts[7]
                 
-                # Extract judgment date from text (remove HTML tags)
-                judgment_text = judgment_cell.get_text(strip=True)
                 # Extract date from the first line/part before any links
-                import re
-                date_match = re.search(r'(\d{2}-\d{2}-\d{4})', judgment_text)
+                date_match = _DATE_RE.search(judgment_text)
                 if date_match:
                     judgment['judgment_date'] = date_match.group(1)
                 else:
                     judgment['judgment_date'] = judgment_text.split('\n')[0].strip() if judgment_text else ''
+            
+            # Scan every anchor once: PDF links in the judgment column (8) are
+            # collected, and the first PDF-like anchor in any column is kept as
+            # a fallback for rows whose judgment column has none
+            pdf_links = []
+            fallback_pdf_link = None
+            
+            for cell_idx, cell_anchors in enumerate(anchors):
+                in_judgment_column = cell_idx == 7
                 
-                # Extract all PDF links from the judgment column
-                links = judgment_cell.find_all('a')
-                pdf_links = []
-                judgment_links = []
-                primary_pdf_link = None
-                
-                for link in links:
-                    href = link.get('href', '').strip()
-                    link_text = link.get_text(strip=True)
-                    onclick = link.get('onclick', '')
-                    
-                    # Skip empty links or API base URL
-                    if not href or href == 'https://api.sci.gov.in/' or href.strip() == '':
-                        continue
+                for href, onclick in cell_anchors:
+                    href = href.strip()
                     
                     # Check for PDF links or download links
-                    if href and ('.pdf' in href.lower() or 'download' in href.lower() or 'judgment' in href.lower()):
-                        pdf_links.append(href)
-                        judgment_links.append(href)  # Store as string instead of object
-                        
-                        # Set first valid PDF as primary link for legacy compatibility
-                        if not primary_pdf_link:
-                            primary_pdf_link = href
+                    pdf_url = None
+                    if href and _is_pdf_href(href):
+                        pdf_url = href
                     
                     # Check for JavaScript onclick handlers that might contain PDF URLs
-                    elif onclick and ('pdf' in onclick.lower() or 'download' in onclick.lower()):
-                        # Try to extract URL from onclick
-                        url_match = re.search(r"['\"]([^'\"]*\.pdf[^'\"]*)['\"]|window\.open\(['\"]([^'\"]*)['\"])", onclick)
+                    elif onclick and _is_pdf_onclick(onclick):
+                        url_match = _ONCLICK_URL_RE.search(onclick)
                         if url_match:
                             pdf_url = url_match.group(1) or url_match.group(2)
-                            pdf_links.append(pdf_url)
-                            judgment_links.append(pdf_url)  # Store as string instead of object
-                            
-                            if not primary_pdf_link:
-                                primary_pdf_link = pdf_url
-                
-                # Store all links
-                if pdf_links:
-                    judgment['pdf_links'] = pdf_links
-                    judgment['judgment_links'] = judgment_links
-                    judgment['pdf_link'] = primary_pdf_link  # Legacy field
-                    judgment['file_url'] = primary_pdf_link  # Legacy field
-            
-            # Extract PDF link from any cell (fallback)
-            if not judgment.get('pdf_link'):
-                pdf_link = None
-                for i, cell in enumerate(cells):
-                    # Look for links in this cell
-                    links = cell.find_all('a')
-                    for link in links:
-                        href = link.get('href', '')
-                        onclick = link.get('onclick', '')
-                        
-                        # Check for PDF links or download links
-                        if href and ('.pdf' in href.lower() or 'download' in href.lower() or 'judgment' in href.lower()):
-                            pdf_link = href
-                            break
-                        
-                        # Check for JavaScript onclick handlers that might contain PDF URLs
-                        if onclick and ('pdf' in onclick.lower() or 'download' in onclick.lower()):
-                            # Try to extract URL from onclick
-                            import re
-                            url_match = re.search(r"['\"]([^'\"]*\.pdf[^'\"]*)['\"]|window\.open\(['\"]([^'\"]*)['\"])", onclick)
-                            if url_match:
-                                pdf_link = url_match.group(1) or url_match.group(2)
-                                break
                     
-                    if pdf_link:
-                        break
-                
-                # Add PDF link if found
-                if pdf_link:
-                    judgment['pdf_link'] = pdf_link
-                    judgment['file_url'] = pdf_link  # Legacy field
+                    if not pdf_url:
+                        continue
+                    
+                    if fallback_pdf_link is None:
+                        fallback_pdf_link = pdf_url
+                    
+                    # Skip empty links or API base URL in the judgment column
+                    if in_judgment_column and href and href != 'https://api.sci.gov.in/':
+                        pdf_links.append(pdf_url)
+            
+            # Store all links
+            if pdf_links:
+                # First valid PDF is the primary link for legacy compatibility
+                judgment['pdf_links'] = pdf_links
+                judgment['judgment_links'] = list(pdf_links)  # Stored as strings, not objects
+                judgment['pdf_link'] = pdf_links[0]  # Legacy field
+                judgment['file_url'] = pdf_links[0]  # Legacy field
+            elif fallback_pdf_link:
+                judgment['pdf_link'] = fallback_pdf_link
+                judgment['file_url'] = fallback_pdf_link  # Legacy field
             
             # Return judgment if we have essential data (case number or PDF link)
             if judgment.get('case_number') or judgment.get('pdf_link'):
@@ -925,27 +1100,15 @@ class SupremeCourtScraper:
     def _wait_for_dynamic_content(self):
         """Wait for dynamic content to load"""
         try:
-            # Wait for various indicators that content might be loading
-            wait_strategies = [
-                # Wait for table to appear
-                lambda: self.page.wait_for_selector('table', timeout=5000),
-                # Wait for any content in cnrresults
-                lambda: self.page.wait_for_selector('#cnrresults table', timeout=5000),
-                # Wait for loading indicators to disappear
-                lambda: self.page.wait_for_selector('.loading', state='hidden', timeout=5000),
-                # Wait for network idle
-                lambda: self.page.wait_for_load_state('networkidle', timeout=10000)
-            ]
-            
-            for strategy in wait_strategies:
+            for strategy in self._DYNAMIC_CONTENT_WAITS:
                 try:
-                    strategy()
+                    strategy(self.page)
                     logger.info("Dynamic content loading detected")
-                    break
+                    return
                 except Exception:
                     continue
                     
-            # Additional wait for any JavaScript execution
+            # Nothing matched; give any JavaScript a little longer to run
             time.sleep(2)
             
         except Exception as e:
@@ -953,38 +1116,50 @@ class SupremeCourtScraper:
     
     def _parse_google_analytics_response(self, body: str, url: str) -> List[Dict[str, str]]:
         """Parse Google Analytics response that contains embedded judgment data"""
+        # Most beacons carry no table at all; skip hashing, decoding and parsing for them
+        if not _ENCODED_TABLE_MARKER_RE.search(url) and not _TABLE_MARKER_RE.search(body):
+            return []
+        
+        # Repeated beacons carry the same dl= payload; decode and parse each pair once
+        extracted = self._cached_parse(
+            ('ga', hash(url), hash(body)),
+            lambda: self._parse_google_analytics_payload(body, url)
+        )
+        return [dict(judgment) for judgment in extracted]
+    
+    def _parse_google_analytics_payload(self, body: str, url: str) -> List[Dict[str, str]]:
+        """Decode URL parameters and body of a Google Analytics response and parse any judgment tables"""
         judgments = []
         
         try:
             # The Google Analytics response might contain HTML data in URL parameters
             # or as embedded content. Let's extract and parse it.
-            from urllib.parse import unquote, parse_qs, urlparse
+            from urllib.parse import unquote, unquote_plus, urlparse
             
-            # Parse URL parameters that might contain judgment data
+            # Scan raw URL parameters; only decode those whose encoded form
+            # looks like table markup
             parsed_url = urlparse(url)
-            params = parse_qs(parsed_url.query)
-            
-            # Look for HTML content in parameters
-            for param_name, param_values in params.items():
-                for param_value in param_values:
-                    decoded_value = unquote(param_value)
+            for param in parsed_url.query.split('&'):
+                param_name, _, param_value = param.partition('=')
+                if not _ENCODED_TABLE_MARKER_RE.search(param_value):
+                    continue
+                
+                decoded_value = unquote(unquote_plus(param_value))
+                
+                # Check if this contains HTML table data
+                if _TABLE_MARKER_RE.search(decoded_value):
+                    logger.info(f"Found HTML table data in parameter: {param_name}")
                     
-                    # Check if this contains HTML table data
-                    if '<table' in decoded_value.lower() or '<tr' in decoded_value.lower():
-                        logger.info(f"Found HTML table data in parameter: {param_name}")
-                        
-                        # Parse the HTML content
-                        soup = BeautifulSoup(decoded_value, 'html.parser')
-                        extracted = self._parse_table_from_soup(soup)
-                        if extracted:
-                            judgments.extend(extracted)
-                            logger.info(f"Extracted {len(extracted)} judgments from GA parameter")
+                    # Already checked for table markup, so hand Lexbor the decoded HTML directly
+                    extracted = self._parse_table_from_soup(LexborHTMLParser(decoded_value))
+                    if extracted:
+                        judgments.extend(extracted)
+                        logger.info(f"Extracted {len(extracted)} judgments from GA parameter")
             
             # Also check the response body for any embedded HTML
-            if '<table' in body.lower() or '<tr' in body.lower():
+            if _TABLE_MARKER_RE.search(body):
                 logger.info("Found HTML table data in response body")
-                soup = BeautifulSoup(body, 'html.parser')
-                extracted = self._parse_table_from_soup(soup)
+                extracted = self._parse_table_from_soup(LexborHTMLParser(body))
                 if extracted:
                     judgments.extend(extracted)
                     logger.info(f"Extracted {len(extracted)} judgments from GA body")
@@ -999,14 +1174,28 @@ class SupremeCourtScraper:
         if not text:
             return ""
         
-        # Remove HTML tags using BeautifulSoup
-        soup = BeautifulSoup(text, 'html.parser')
-        cleaned_text = soup.get_text(separator=' ', strip=True)
+        # Most fields are plain text; skip the regexes entirely for those
+        if '<' not in text:
+            if '&' in text:
+                text = html.unescape(text)
+            return ' '.join(text.split())
         
-        # Clean up extra whitespace
-        cleaned_text = ' '.join(cleaned_text.split())
+        # Remove HTML tags, decode entities and clean up extra whitespace
+        cleaned_text = html.unescape(_TAG_RE.sub(' ', text))
+        return _WS_RE.sub(' ', cleaned_text).strip()
+    
+    def _remember_seen(self, candidates: List[Tuple[str, Tuple[str, str, str], Dict]]):
+        """Add (judgment_id, content_key, ...) candidates to the bounded seen cache"""
+        for judgment_id, content_key, _ in candidates:
+            key_hash = hash(content_key)
+            self._seen_content_keys.add(key_hash)
+            self._seen_ids.add(judgment_id)
+            self._seen_order.append((key_hash, judgment_id))
         
-        return cleaned_text
+        while len(self._seen_order) > _SEEN_CACHE_SIZE:
+            key_hash, judgment_id = self._seen_order.popleft()
+            self._seen_content_keys.discard(key_hash)
+            self._seen_ids.discard(judgment_id)
     
     def _save_judgments_to_mongodb(self, judgments: List[Dict[str, str]]) -> bool:
         """Save judgment data directly to MongoDB without S3 upload with duplicate prevention"""
@@ -1014,87 +1203,123 @@ class SupremeCourtScraper:
             if not judgments:
                 return True
                 
-            saved_count = 0
             duplicate_count = 0
+            candidates = []
             
             for judgment in judgments:
                 try:
-                    # Clean HTML content from all fields, but preserve arrays
+                    # Extracted fields are already tag-free text, so only normalize
+                    # whitespace; values still carrying markup or entities (e.g. raw
+                    # JSON fields) get a full clean. Arrays are kept as arrays.
                     cleaned_judgment = {}
                     for key, value in judgment.items():
                         if isinstance(value, list):
-                            # Keep arrays as arrays, don't convert to string
                             cleaned_judgment[key] = value
-                        elif value:
-                            # Clean HTML content for string values
-                            cleaned_judgment[key] = self._clean_html_content(str(value))
-                        else:
+                        elif not value:
                             cleaned_judgment[key] = ""
+                        else:
+                            value = str(value)
+                            if '<' in value or '&' in value:
+                                cleaned_judgment[key] = self._clean_html_content(value)
+                            else:
+                                cleaned_judgment[key] = ' '.join(value.split())
                     
-                    # Check for duplicates by content using both old and new field names
+                    # Duplicate keys using both old and new field names
                     diary_no = cleaned_judgment.get('diary_number') or cleaned_judgment.get('diary_no', '')
                     case_number = cleaned_judgment.get('case_number', '')
                     judgment_date = cleaned_judgment.get('judgment_date', '')
                     
-                    existing_id = self.mongo_client.find_duplicate_by_content(
-                        diary_no, case_number, judgment_date
-                    )
-                    
-                    if existing_id:
-                        duplicate_count += 1
-                        logger.info(f"Duplicate judgment found, skipping: {case_number} (existing ID: {existing_id})")
-                        continue
-                    
                     # Generate unique judgment ID
-                    judgment_id = f"{diary_no}_{case_number}_{judgment_date}".replace('/', '_').replace(' ', '_').replace(':', '_')
-                    
-                    # Check if judgment ID already exists
-                    if self.mongo_client.judgment_exists(judgment_id):
-                        duplicate_count += 1
-                        logger.info(f"Judgment ID already exists, skipping: {judgment_id}")
-                        continue
+                    judgment_id = make_judgment_id(diary_no, case_number, judgment_date)
                     
-                    # Create metadata object with all available fields
-                    metadata = JudgmentMetadata(
-                        judgment_id=judgment_id,
-                        # Court hierarchy information
-                        court_type="supreme_court",
-                        court_level=1,
-                        court_name="Supreme Court of India",
-                        jurisdiction="India",
-                        # New schema fields
-                        serial_number=cleaned_judgment.get('serial_number', ''),
-                        diary_number=diary_no,
-                        case_number=case_number,
-                        petitioner_respondent=cleaned_judgment.get('petitioner_respondent', ''),
-                        advocate=cleaned_judgment.get('advocate', ''),
-                        bench=cleaned_judgment.get('bench', ''),
-                        judgment_by=cleaned_judgment.get('judgment_by', ''),
-                        judgment_date=judgment_date,
-                        # Multiple PDF links support
-                        pdf_links=cleaned_judgment.get('pdf_links', []),
-                        judgment_links=cleaned_judgment.get('judgment_links', []),
-                        # Legacy fields for backward compatibility
-                        diary_no=diary_no,
-                        title=cleaned_judgment.get('petitioner_respondent', ''),
-                        judge=cleaned_judgment.get('judgment_by', ''),
-                        # File information
-                        file_url=cleaned_judgment.get('pdf_link', ''),
-                        pdf_link=cleaned_judgment.get('pdf_link', ''),
-                        file_size=0,  # No file downloaded yet
-                        processing_status="completed"  # Mark as completed since we have the metadata and PDF link
-                    )
+                    candidates.append((judgment_id, (diary_no, case_number, judgment_date), cleaned_judgment))
                     
-                    # Save to MongoDB
-                    if self.mongo_client.insert_judgment(metadata):
-                        saved_count += 1
-                        logger.info(f"Saved new judgment to MongoDB: {cleaned_judgment.get('case_number', 'Unknown')}")
-                    else:
-                        logger.warning(f"Failed to save judgment: {cleaned_judgment.get('case_number', 'Unknown')}")
-                        
                 except Exception as e:
-                    logger.error(f"Error saving individual judgment: {e}")
+                    logger.error(f"Error preparing individual judgment: {e}")
+                    continue
+            
+            # Skip judgments already seen earlier in this run without asking MongoDB
+            unseen = [
+                c for c in candidates
+                if hash(c[1]) not in self._seen_content_keys and c[0] not in self._seen_ids
+            ]
+            if len(unseen) < len(candidates):
+                duplicate_count += len(candidates) - len(unseen)
+                logger.debug(f"Skipped {len(candidates) - len(unseen)} judgments already seen this run")
+            
+            # Look up existing IDs and content keys for the whole batch at once;
+            # a first-run backfill starts from an empty collection, so skip the lookups
+            if self.config.scraping.first_run:
+                existing_ids, existing_keys = set(), set()
+            else:
+                existing_ids = self.mongo_client.find_existing_ids([c[0] for c in unseen])
+                # IDs are built from the content key, so only unmatched IDs need the content query
+                existing_keys = self.mongo_client.find_existing_content_keys(
+                    [c[1] for c in unseen if c[0] not in existing_ids]
+                )
+            # Content keys MongoDB reported as stored (existing_keys also collects this batch below)
+            stored_keys = set(existing_keys)
+            
+            new_judgments = []
+            for judgment_id, content_key, cleaned_judgment in unseen:
+                diary_no, case_number, judgment_date = content_key
+                
+                # Also catches duplicates within this batch
+                if content_key in existing_keys:
+                    duplicate_count += 1
+                    logger.info(f"Duplicate judgment found, skipping: {case_number}")
+                    continue
+                
+                if judgment_id in existing_ids:
+                    duplicate_count += 1
+                    logger.info(f"Judgment ID already exists, skipping: {judgment_id}")
                     continue
+                
+                existing_keys.add(content_key)
+                existing_ids.add(judgment_id)
+                
+                # Create metadata object with all available fields
+                new_judgments.append(JudgmentMetadata(
+                    judgment_id=judgment_id,
+                    # Court hierarchy information
+                    court_type="supreme_court",
+                    court_level=1,
+                    court_name="Supreme Court of India",
+                    jurisdiction="India",
+                    # New schema fields
+                    serial_number=cleaned_judgment.get('serial_number', ''),
+                    diary_number=diary_no,
+                    case_number=case_number,
+                    petitioner_respondent=cleaned_judgment.get('petitioner_respondent', ''),
+                    advocate=cleaned_judgment.get('advocate', ''),
+                    bench=cleaned_judgment.get('bench', ''),
+                    judgment_by=cleaned_judgment.get('judgment_by', ''),
+                    judgment_date=judgment_date,
+                    # Multiple PDF links support
+                    pdf_links=cleaned_judgment.get('pdf_links', []),
+                    judgment_links=cleaned_judgment.get('judgment_links', []),
+                    # Legacy fields for backward compatibility
+                    diary_no=diary_no,
+                    title=cleaned_judgment.get('petitioner_respondent', ''),
+                    judge=cleaned_judgment.get('judgment_by', ''),
+                    # File information
+                    file_url=cleaned_judgment.get('pdf_link', ''),
+                    pdf_link=cleaned_judgment.get('pdf_link', ''),
+                    file_size=0,  # No file downloaded yet
+                    processing_status="completed"  # Mark as completed since we have the metadata and PDF link
+                ))
+            
+            # Backfills use plain unordered inserts (the unique index drops any
+            # duplicates); steady-state runs save in a single idempotent write
+            if self.config.scraping.first_run:
+                saved_count = self.mongo_client.insert_judgments(new_judgments)
+            else:
+                saved_count = self.mongo_client.bulk_upsert(new_judgments)
+            
+            # Remember only judgments now known to be stored, so any that failed to
+            # write are retried when they turn up again this run
+            stored_ids = self.mongo_client.known_ids([c[0] for c in unseen])
+            self._remember_seen([c for c in unseen if c[0] in stored_ids or c[1] in stored_keys])
             
             logger.info(f"Processing complete: {saved_count} new judgments saved, {duplicate_count} duplicates skipped out of {len(judgments)} total")
             return saved_count > 0
@@ -1125,9 +1350,8 @@ class SupremeCourtScraper:
                     
                     # Try to detect if response contains judgment data
                     if 'body' in response:
-                        body = response['body'].lower()
-                        indicators = ['judgment', 'case', 'petitioner', 'respondent', 'diary', 'pdf']
-                        found_indicators = [ind for ind in indicators if ind in body]
+                        found = {m.lower() for m in _INDICATOR_RE.findall(response['body'], 0, _INDICATOR_SCAN_LIMIT)}
+                        found_indicators = [ind for ind in _INDICATORS if ind in found]
                         if found_indicators:
                             logger.info(f"    -> Potential judgment data detected: {found_indicators}")
             
@@ -1142,16 +1366,19 @@ class SupremeCourtScraper:
             debug_file = f"network_debug_{date_range.start_date.strftime('%Y%m%d')}_{date_range.end_date.strftime('%Y%m%d')}.json"
             debug_data = {
                 'date_range': {
-                    'start': date_range.start_date.isoformat(),
-                    'end': date_range.end_date.isoformat()
+                    'start': date_range.start_date,
+                    'end': date_range.end_date
                 },
                 'api_endpoints': self.api_endpoints,
-                'captured_responses': self.captured_responses,
-                'timestamp': datetime.now().isoformat()
+                'captured_responses': list(self.captured_responses),
+                'timestamp': datetime.now()
             }
             
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                json.dump(debug_data, f, indent=2, ensure_ascii=False)
+            with open(debug_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    debug_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+                ))
                 
             logger.info(f"Network debug information saved to: {debug_file}")
             
@@ -1177,22 +1404,14 @@ class SupremeCourtScraper:
                 text_content = parent.get_text(separator=' ', strip=True)
                 
                 # Try to extract case number (common patterns)
-                import re
-                case_patterns = [
-                    r'(\d+/\d+)',
-                    r'([A-Z]+\s*\d+\s*/\s*\d+)',
-                    r'(Case\s*No[.:]*\s*[^\s]+)'
-                ]
-                
-                for pattern in case_patterns:
-                    match = re.search(pattern, text_content, re.IGNORECASE)
+                for pattern in _CASE_NUMBER_RES:
+                    match = pattern.search(text_content)
                     if match:
                         metadata['case_number'] = match.group(1).strip()
                         break
                 
                 # Try to extract date (dd-mm-yyyy or dd/mm/yyyy)
-                date_pattern = r'(\d{1,2}[-/]\d{1,2}[-/]\d{4})'
-                date_match = re.search(date_pattern, text_content)
+                date_match = _DATE_LOOSE_RE.search(text_content)
                 if date_match:
                     metadata['judgment_date'] = date_match.group(1).replace('/', '-')
                 
@@ -1215,17 +1434,17 @@ class SupremeCourtScraper:
             parsed_url = urlparse(file_url)
             filename = os.path.basename(parsed_url.path)
             if not filename or not filename.endswith('.pdf'):
-                filename = f"judgment_{int(time.time())}.pdf"
+                filename = f"judgment_{time.time_ns()}.pdf"
             
-            # Download using requests for better control
-            response = requests.get(file_url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            # Save file
-            file_path = self.download_dir / filename
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Download over the pooled session
+            with self._http.get(file_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                
+                # Save file straight from the raw stream, undoing any gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                file_path = self.download_dir / filename
+                with open(file_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
             
             # Verify file was downloaded
             if file_path.exists() and file_path.stat().st_size > 0:
@@ -1239,6 +1458,77 @@ class SupremeCourtScraper:
             logger.error(f"Failed to download {judgment_data.get('file_url', 'unknown')}: {e}")
             return None
     
+    def download_judgments(self, judgments: List[Dict[str, str]]) -> List[Optional[str]]:
+        """Download judgment files concurrently, returning file paths in input order"""
+        if not judgments:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return list(executor.map(self.download_judgment_file, judgments))
+    
+    async def _download_and_upload(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                                   judgment: JudgmentMetadata) -> Optional[Dict]:
+        """Stream one judgment PDF into memory and upload it to S3"""
+        async with sem:
+            try:
+                buffer = io.BytesIO()
+                async with client.stream('GET', judgment.file_url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(1 << 20):
+                        buffer.write(chunk)
+                
+                file_name = os.path.basename(urlparse(judgment.file_url).path) or f"{judgment.judgment_id}.pdf"
+                
+                # boto3 is blocking; its client is thread-safe, so upload off the event loop
+                return await asyncio.to_thread(
+                    self.s3_client.upload_fileobj,
+                    buffer,
+                    file_name,
+                    judgment.judgment_date,
+                    judgment.case_number,
+                    {
+                        "judgment_id": judgment.judgment_id,
+                        "title": judgment.title or "Unknown",
+                        "case_number": judgment.case_number or "Unknown"
+                    }
+                )
+                
+            except Exception as e:
+                logger.error(f"Failed to download/upload {judgment.file_url}: {e}")
+                return None
+    
+    async def _download_and_upload_all(self, judgments: List[JudgmentMetadata]) -> List[Optional[Dict]]:
+        """Download and upload many judgments, 16 at a time"""
+        sem = asyncio.Semaphore(16)
+        limits = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        
+        async with httpx.AsyncClient(limits=limits, timeout=60, follow_redirects=True) as client:
+            return await asyncio.gather(*[
+                self._download_and_upload(client, sem, judgment)
+                for judgment in judgments
+            ])
+    
+    def upload_judgments_to_s3(self, judgments: List[JudgmentMetadata]) -> int:
+        """Stream judgment PDFs straight to S3 concurrently, returning how many were uploaded"""
+        judgments = [judgment for judgment in judgments if judgment.file_url]
+        if not judgments:
+            return 0
+        
+        results = asyncio.run(self._download_and_upload_all(judgments))
+        
+        uploaded = 0
+        for judgment, s3_result in zip(judgments, results):
+            if s3_result:
+                self.mongo_client.mark_as_uploaded(judgment.judgment_id, s3_result)
+                self.stats["successful_downloads"] += 1
+                uploaded += 1
+            else:
+                self._pending_failures.append((judgment.judgment_id, "S3 upload failed"))
+                self.stats["upload_failures"] += 1
+        
+        logger.info(f"Uploaded {uploaded}/{len(judgments)} judgment files to S3")
+        return uploaded
+    
     def process_judgment(self, judgment_data: Dict[str, str], date_range: DateRange) -> bool:
         """Process a single judgment: download, store metadata, upload to S3"""
         try:
@@ -1271,7 +1561,9 @@ class SupremeCourtScraper:
             self.mongo_client.insert_judgment(judgment)
             
             # NOTE: S3 upload functionality commented out as PDF links are extracted directly
-            # No need to download and upload files since we have direct PDF URLs
+            # No need to download and upload files since we have direct PDF URLs.
+            # To re-enable, prefer upload_judgments_to_s3() on a batch of judgments,
+            # which streams downloads to S3 concurrently without touching disk.
             
             # # Download file
             # file_path = self.download_judgment_file(judgment_data)
@@ -1327,46 +1619,63 @@ class SupremeCourtScraper:
         except Exception as e:
             logger.error(f"Failed to process judgment: {e}")
             if 'judgment' in locals():
-                self.mongo_client.mark_as_failed(judgment.judgment_id, str(e))
+                # Flushed in one bulk write at the end of the date range
+                self._pending_failures.append((judgment.judgment_id, str(e)))
             return False
     
     def process_date_range(self, date_range: DateRange) -> bool:
         """Process all judgments for a specific date range"""
         try:
             logger.info(f"Processing date range: {date_range}")
+            self._last_status = "ok"
             
-            # Navigate to search page
-            if not self.navigate_to_search_page():
+            # Reuse the already-loaded search page; navigate only when it isn't current
+            reused_page = self._on_search_page()
+            if not reused_page and not self.navigate_to_search_page():
                 return False
             
             # Fill search form
             if not self.fill_search_form(date_range):
                 return False
             
+            # Only responses captured from here on belong to this range
+            responses_before = len(self.captured_responses)
+            
             # Solve CAPTCHA and submit
             if not self.solve_and_submit_captcha():
-                return False
+                if not reused_page:
+                    return False
+                
+                # The reused page may hold stale form/CAPTCHA state; retry on a fresh load
+                logger.info("Search failed on reused page, reloading search page")
+                if not (self.navigate_to_search_page() and
+                        self.fill_search_form(date_range) and
+                        self.solve_and_submit_captcha()):
+                    return False
             
             # Extract judgment links from network responses (after CAPTCHA submission)
             judgments = self._extract_from_network_responses()
             
-            # If no network responses captured, try traditional extraction
-            if not judgments:
+            # An accepted but empty results response means the range has no judgments;
+            # otherwise fall back to traditional extraction
+            if not judgments and self._results_response_captured(responses_before):
+                logger.info(f"Results API returned no judgments for date range: {date_range}")
+            elif not judgments:
                 logger.info("No judgments found in network responses, trying traditional extraction...")
                 judgments = self.extract_judgment_links()
-            
-            # If still no links found, try direct API calls as fallback
-            if not judgments:
-                logger.warning(f"No judgment links found via web scraping for date range: {date_range}")
-                logger.info("Attempting direct API calls as fallback...")
-                
-                judgments = self.try_direct_api_calls(date_range)
                 
+                # If still no links found, try direct API calls as fallback
                 if not judgments:
-                    logger.info(f"No judgments found for date range: {date_range}")
-                    return True
-                else:
-                    logger.info(f"Successfully found {len(judgments)} judgments via direct API calls")
+                    logger.warning(f"No judgment links found via web scraping for date range: {date_range}")
+                    logger.info("Attempting direct API calls as fallback...")
+                    
+                    judgments = self.try_direct_api_calls(date_range)
+                    
+                    if not judgments:
+                        logger.info(f"No judgments found for date range: {date_range}")
+                        return True
+                    else:
+                        logger.info(f"Successfully found {len(judgments)} judgments via direct API calls")
             
             # Save all judgments to MongoDB with duplicate prevention and HTML cleaning
             if judgments:
@@ -1383,7 +1692,7 @@ class SupremeCourtScraper:
             self.log_network_analysis()
             
             # Save network debug info if enabled
-            if hasattr(self.config, 'debug') and self.config.debug:
+            if self._debug:
                 self.save_network_debug_info(date_range)
             
             return True
@@ -1395,15 +1704,135 @@ class SupremeCourtScraper:
             self.log_network_analysis()
             
             return False
+        finally:
+            self._flush_pending_failures()
+            self.captured_responses.clear()
+    
+    def _flush_pending_failures(self):
+        """Mark all queued failed judgments in a single bulk write"""
+        if self._pending_failures:
+            self.mongo_client.mark_many_as_failed(self._pending_failures)
+            self._pending_failures.clear()
+    
+    def _find_results_api_url(self) -> Optional[str]:
+        """Return the most recent captured judgment-date search request URL"""
+        for endpoint in reversed(self.api_endpoints):
+            if _RESULTS_API_ACTION in endpoint:
+                return endpoint
+        return None
+    
+    def _results_api_url_for_range(self, template_url: str, date_range: DateRange) -> str:
+        """Rewrite the date parameters of a captured search request URL"""
+        from_date, to_date = date_range.to_string_format()
+        parsed_url = urlparse(template_url)
+        params = [
+            (key, from_date if key == 'from_date' else to_date if key == 'to_date' else value)
+            for key, value in parse_qsl(parsed_url.query, keep_blank_values=True)
+        ]
+        return parsed_url._replace(query=urlencode(params)).geturl()
+    
+    async def _fetch_range_async(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                                 template_url: str, date_range: DateRange) -> Tuple[DateRange, Optional[List[Dict[str, str]]]]:
+        """Fetch and parse one date range through the results API; None means it must be retried in the browser"""
+        async with sem:
+            backoff = True
+            try:
+                response = await client.get(self._results_api_url_for_range(template_url, date_range))
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                
+                # A rejected CAPTCHA token comes back as success: false
+                if not isinstance(data, dict) or not data.get('success'):
+                    logger.warning(f"Results API rejected date range {date_range}")
+                    return date_range, None
+                
+                backoff = False
+                return date_range, self._parse_json_for_judgments(data)
+                
+            except Exception as e:
+                logger.warning(f"Results API request failed for {date_range}: {e}")
+                return date_range, None
+            finally:
+                # Delay between date ranges per concurrency slot, backing off only after failures
+                await asyncio.sleep(self.config.scraping.retry_delay if backoff else _HEALTHY_RANGE_DELAY)
+    
+    async def _fetch_ranges_async(self, template_url: str, cookies: Dict[str, str], user_agent: str,
+                                  date_ranges: List[DateRange]) -> List[Tuple[DateRange, Optional[List[Dict[str, str]]]]]:
+        """Fetch many date ranges concurrently over one pooled client"""
+        headers = {
+            'User-Agent': user_agent,
+            'Accept': 'application/json, text/html, */*',
+            'Referer': self.config.scraping.base_url,
+            'X-Requested-With': 'XMLHttpRequest'
+        }
+        limits = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        sem = asyncio.Semaphore(self.config.scraping.concurrent_ranges)
+        
+        async with httpx.AsyncClient(cookies=cookies, headers=headers, limits=limits, timeout=30) as client:
+            return await asyncio.gather(*[
+                self._fetch_range_async(client, sem, template_url, date_range)
+                for date_range in date_ranges
+            ])
+    
+    def _run_concurrent(self, remaining_ranges: List[DateRange],
+                        completed_ranges: List[DateRange], failed_ranges: List[DateRange]) -> List[DateRange]:
+        """Bootstrap a session in the browser, then replay the results API for
+        the other ranges concurrently. Returns ranges left for the browser."""
+        bootstrap_range, rest = remaining_ranges[0], remaining_ranges[1:]
+        
+        # Solve the CAPTCHA once in the browser to capture a working search request
+        logger.info(f"Bootstrapping concurrent mode with {bootstrap_range}")
+        if self.process_date_range(bootstrap_range):
+            completed_ranges.append(bootstrap_range)
+            self.date_manager.append_result(bootstrap_range, True)
+        else:
+            failed_ranges.append(bootstrap_range)
+            self.date_manager.append_result(bootstrap_range, False)
+        
+        template_url = self._find_results_api_url()
+        if not template_url:
+            logger.warning("No results API request captured; processing remaining ranges sequentially")
+            return rest
+        
+        cookies = {cookie['name']: cookie['value'] for cookie in self.page.context.cookies()}
+        user_agent = self.page.evaluate("navigator.userAgent")
+        
+        logger.info(f"Fetching {len(rest)} date ranges, {self.config.scraping.concurrent_ranges} at a time")
+        results = asyncio.run(self._fetch_ranges_async(template_url, cookies, user_agent, rest))
+        
+        browser_ranges = []
+        for date_range, judgments in results:
+            if judgments is None:
+                browser_ranges.append(date_range)
+                continue
+            
+            if judgments:
+                if self._save_judgments_to_mongodb(judgments):
+                    self.stats["total_processed"] += len(judgments)
+                    logger.info(f"Successfully processed {len(judgments)} judgments for date range: {date_range}")
+                else:
+                    logger.warning(f"Failed to save judgments for date range: {date_range}")
+            else:
+                logger.info(f"No judgments found for date range: {date_range}")
+            completed_ranges.append(date_range)
+            self.date_manager.append_result(date_range, True)
+        
+        if browser_ranges:
+            logger.info(f"{len(browser_ranges)} date ranges need the browser")
+        return browser_ranges
     
     def run(self):
         """Main execution method"""
         try:
-            self.stats["start_time"] = datetime.now()
+            self.stats["start_ts"] = time.monotonic()
             logger.info("Starting Supreme Court judgment scraper")
             
-            # Setup browser
+            # Setup browser and load the search page once for all date ranges
             self.setup_browser()
+            try:
+                self.navigate_to_search_page()
+            except Exception as e:
+                logger.warning(f"Initial navigation failed, will retry per date range: {e}")
             
             # Get remaining date ranges
             remaining_ranges = self.date_manager.get_remaining_ranges()
@@ -1415,30 +1844,34 @@ class SupremeCourtScraper:
             completed_ranges = []
             failed_ranges = []
             
+            # Opt-in: fetch most ranges concurrently, leaving failures to the browser loop
+            if self.config.scraping.concurrent_ranges > 0 and total_ranges > 1:
+                remaining_ranges = self._run_concurrent(remaining_ranges, completed_ranges, failed_ranges)
+                total_ranges = len(remaining_ranges)
+            
             for i, date_range in enumerate(remaining_ranges, 1):
                 logger.info(f"Progress: {i}/{total_ranges} - {date_range}")
                 
                 try:
-                    if self.process_date_range(date_range):
-                        completed_ranges.append(date_range)
-                    else:
-                        failed_ranges.append(date_range)
-                        
-                    # Save progress periodically
-                    if i % 10 == 0:
-                        self.date_manager.save_progress(completed_ranges, failed_ranges)
-                        
+                    success = self.process_date_range(date_range)
                 except Exception as e:
                     logger.error(f"Error processing date range {date_range}: {e}")
+                    success = False
+                
+                # Record progress as soon as each range finishes
+                if success:
+                    completed_ranges.append(date_range)
+                else:
                     failed_ranges.append(date_range)
+                self.date_manager.append_result(date_range, success)
                 
-                # Delay between date ranges
-                time.sleep(self.config.scraping.retry_delay)
-            
-            # Save final progress
-            self.date_manager.save_progress(completed_ranges, failed_ranges)
+                # Back off only after CAPTCHA failures or rate limiting/server errors
+                if self._last_status in _BACKOFF_STATUSES:
+                    time.sleep(self.config.scraping.retry_delay)
+                else:
+                    time.sleep(_HEALTHY_RANGE_DELAY)
             
-            self.stats["end_time"] = datetime.now()
+            self.stats["duration_s"] = time.monotonic() - self.stats["start_ts"]
             self._print_final_statistics()
             
         except Exception as e:
@@ -1446,39 +1879,45 @@ class SupremeCourtScraper:
             raise
         finally:
             self.cleanup_browser()
+            self._http.close()
             self.mongo_client.close()
     
     def _print_final_statistics(self):
         """Print final execution statistics"""
-        duration = self.stats["end_time"] - self.stats["start_time"]
+        duration = timedelta(seconds=self.stats["duration_s"])
         
-        print("\n" + "="*60)
-        print("SUPREME COURT SCRAPER - FINAL STATISTICS")
-        print("="*60)
-        print(f"Execution time: {duration}")
-        print(f"Total judgments processed: {self.stats['total_processed']}")
-        print(f"Successful downloads: {self.stats['successful_downloads']}")
-        print(f"Failed downloads: {self.stats['failed_downloads']}")
-        print(f"CAPTCHA failures: {self.stats['captcha_failures']}")
-        print(f"Upload failures: {self.stats['upload_failures']}")
+        lines = [
+            "",
+            "=" * 60,
+            "SUPREME COURT SCRAPER - FINAL STATISTICS",
+            "=" * 60,
+            f"Execution time: {duration}",
+            f"Total judgments processed: {self.stats['total_processed']}",
+            f"Successful downloads: {self.stats['successful_downloads']}",
+            f"Failed downloads: {self.stats['failed_downloads']}",
+            f"CAPTCHA failures: {self.stats['captcha_failures']}",
+            f"Upload failures: {self.stats['upload_failures']}",
+        ]
         
         if self.stats['total_processed'] > 0:
             success_rate = (self.stats['successful_downloads'] / self.stats['total_processed']) * 100
-            print(f"Success rate: {success_rate:.1f}%")
+            lines.append(f"Success rate: {success_rate:.1f}%")
         
         # Database statistics
         db_stats = self.mongo_client.get_statistics()
-        print(f"\nDatabase statistics:")
-        for key, value in db_stats.items():
-            print(f"  {key}: {value}")
+        lines.append("\nDatabase statistics:")
+        lines.extend([f"  {key}: {value}" for key, value in db_stats.items()])
         
         # S3 statistics
         s3_stats = self.s3_client.get_storage_stats()
-        print(f"\nS3 storage statistics:")
-        for key, value in s3_stats.items():
-            print(f"  {key}: {value}")
+        lines.append("\nS3 storage statistics:")
+        lines.extend([f"  {key}: {value}" for key, value in s3_stats.items()])
+        
+        lines.append("=" * 60)
         
-        print("="*60)
+        # Emit the whole report in one write
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 # Example usage
 if __name__ == "__main__":
@@ -7,10 +7,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from supreme_court_scraper import SupremeCourtScraper
-from config import config
-from bs4 import BeautifulSoup
-import json
+from conftest import get_scraper, format_judgments
+from selectolax.lexbor import LexborHTMLParser
 from loguru import logger
 
 def test_html_parsing():
@@ -54,26 +52,22 @@ def test_html_parsing():
     """
     
     # Create scraper instance
-    scraper = SupremeCourtScraper(config)
+    scraper = get_scraper()
     
     # Parse the HTML
-    soup = BeautifulSoup(sample_html, 'html.parser')
-    judgments = scraper._parse_table_from_soup(soup)
+    judgments = scraper._parse_table_from_soup(sample_html)
     
     print(f"\n=== HTML Parsing Test ===")
     print(f"Found {len(judgments)} judgments:")
-    for i, judgment in enumerate(judgments, 1):
-        print(f"\nJudgment {i}:")
-        for key, value in judgment.items():
-            print(f"  {key}: {value}")
+    print(format_judgments(judgments))
     
-    return len(judgments) > 0
+    assert judgments, "No judgments parsed from the sample HTML"
 
 def test_network_response_simulation():
     """Test network response parsing with simulated data"""
     
     # Create scraper instance
-    scraper = SupremeCourtScraper(config)
+    scraper = get_scraper()
     
     # Simulate captured network responses
     sample_html_response = """
@@ -101,37 +95,43 @@ def test_network_response_simulation():
         }
     ]
     
-    # Debug: Print the HTML structure
-    print(f"\nDEBUG: Sample HTML response:")
-    print(sample_html_response)
-    
-    # Debug: Parse and check table structure
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(sample_html_response, 'html.parser')
-    table = soup.find('table')
-    if table:
-        rows = table.find_all('tr')
-        print(f"\nDEBUG: Found table with {len(rows)} rows")
-        for i, row in enumerate(rows):
-            cells = row.find_all('td')
-            print(f"  Row {i+1}: {len(cells)} cells")
-            if cells:
-                for j, cell in enumerate(cells):
-                    print(f"    Cell {j+1}: '{cell.get_text(strip=True)}'")
-    else:
-        print("\nDEBUG: No table found in HTML")
+    # Debug output only when SCRAPER_DEBUG is set
+    if os.environ.get("SCRAPER_DEBUG"):
+        # Debug: Print the HTML structure
+        print(f"\nDEBUG: Sample HTML response:")
+        print(sample_html_response)
+        
+        # Debug: Parse and check table structure
+        tree = LexborHTMLParser(sample_html_response)
+        table = tree.css_first('table')
+        if table:
+            rows = table.css('tr')
+            lines = [f"\nDEBUG: Found table with {len(rows)} rows"]
+            for i, row in enumerate(rows):
+                cells = row.css('td')
+                lines.append(f"  Row {i+1}: {len(cells)} cells")
+                lines.extend(f"    Cell {j+1}: '{cell.text(strip=True)}'" for j, cell in enumerate(cells))
+            print("\n".join(lines))
+        else:
+            print("\nDEBUG: No table found in HTML")
     
     # Test extraction
     judgments = scraper._extract_from_network_responses()
     
     print(f"\n=== Network Response Parsing Test ===")
     print(f"Found {len(judgments)} judgments from network responses:")
-    for i, judgment in enumerate(judgments, 1):
-        print(f"\nJudgment {i}:")
-        for key, value in judgment.items():
-            print(f"  {key}: {value}")
+    print(format_judgments(judgments))
     
-    return len(judgments) > 0
+    assert judgments, "No judgments extracted from the simulated network responses"
+
+def _passed(test) -> bool:
+    """Run one test function outside pytest, reporting a failed assert instead of raising"""
+    try:
+        test()
+        return True
+    except AssertionError as e:
+        print(f"❌ {test.__name__}: {e}")
+        return False
 
 def main():
     """Run all tests"""
@@ -139,10 +139,10 @@ def main():
     print("=" * 50)
     
     # Test HTML parsing
-    html_test_passed = test_html_parsing()
+    html_test_passed = _passed(test_html_parsing)
     
     # Test network response simulation
-    network_test_passed = test_network_response_simulation()
+    network_test_passed = _passed(test_network_response_simulation)
     
     print(f"\n=== Test Results ===")
     print(f"HTML Parsing Test: {'PASSED' if html_test_passed else 'FAILED'}")
@@ -8,100 +8,95 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from supreme_court_scraper import SupremeCourtScraper
-from config import config
+from conftest import get_scraper, format_judgments
 from date_manager import DateRange
 from datetime import datetime
-import json
 
-def test_complete_workflow():
-    """Test the complete workflow from API response to MongoDB"""
-    print("=== Complete Workflow Test ===")
-    
-    # Sample API response from user's screenshot
-    sample_response = {
-        "success": True,
-        "data": {
-            "pagination": False,
-            "resultsHtml": '''
-            <div class="text-center mr-top15">
-                <a href="https://www.sci.gov.in/" title="Go to home" class="site_logo" rel="home">
-                    <img class="img-thumbnail" alt="logo" id="logo" src="https://cdnbbsr.s3waas.gov.in/s3ec0409f1f4972d33619a60c30f3550e/uploads/2023/05/2023050812.png">
-                </a>
-                <br/>
-                <p class="mr-top15"><strong>SUPREME COURT OF INDIA</strong><br/>
-                </p>
-            </div>
-            <div class="distTableContent">
-                <table class="">
-                    <thead>
-                        <tr>
-                            <th scope="col">Serial Number</th>
-                            <th scope="col">Diary Number</th>
-                            <th scope="col">Case Number</th>
-                            <th scope="col">Petitioner / Respondent</th>
-                            <th scope="col">Petitioner/Respondent Advocate</th>
-                            <th scope="col">Bench</th>
-                            <th scope="col">Judgement By</th>
-                            <th scope="col">Judgement</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        <tr id="001ea78633dd4e7692a0831f616b" data-diary-no="/9948">
-                            <td>1</td>
-                            <td>/9948</td>
-                            <td>-</td>
-                            <td class="petitioners text-center">
-                                <div>
-                                    <a class="respondents">CIVIL</a><br><center>_</center>
-                                </div>
-                            </td>
-                            <td></td>
-                            <td>
+# Sample API response from user's screenshot
+_SAMPLE_RESPONSE = {
+    "success": True,
+    "data": {
+        "pagination": False,
+        "resultsHtml": '''
+        <div class="text-center mr-top15">
+            <a href="https://www.sci.gov.in/" title="Go to home" class="site_logo" rel="home">
+                <img class="img-thumbnail" alt="logo" id="logo" src="https://cdnbbsr.s3waas.gov.in/s3ec0409f1f4972d33619a60c30f3550e/uploads/2023/05/2023050812.png">
+            </a>
+            <br/>
+            <p class="mr-top15"><strong>SUPREME COURT OF INDIA</strong><br/>
+            </p>
+        </div>
+        <div class="distTableContent">
+            <table class="">
+                <thead>
+                    <tr>
+                        <th scope="col">Serial Number</th>
+                        <th scope="col">Diary Number</th>
+                        <th scope="col">Case Number</th>
+                        <th scope="col">Petitioner / Respondent</th>
+                        <th scope="col">Petitioner/Respondent Advocate</th>
+                        <th scope="col">Bench</th>
+                        <th scope="col">Judgement By</th>
+                        <th scope="col">Judgement</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr id="001ea78633dd4e7692a0831f616b" data-diary-no="/9948">
+                        <td>1</td>
+                        <td>/9948</td>
+                        <td>-</td>
+                        <td class="petitioners text-center">
+                            <div>
                                 <a class="respondents">CIVIL</a><br><center>_</center>
-                            </td>
-                            <td></td>
-                            <td>
-                                <a target="_blank" href="https://api.sci.gov.in/jonew/judis/25825.pdf">15-01-2004(English)</a><br/><a><br/></a> target="_blank"
-                            </td>
-                        </tr>
-                        <tr id="001ea78633dd4e7692a0831f616b" data-diary-no="12/2004">
-                            <td>2</td>
-                            <td>12/2004</td>
-                            <td>C.A. No.-000131-000131 - 2004</td>
-                            <td class="petitioners text-center">
-                                <div>
-                                    <a class="respondents">CIVIL</a><br><center>_</center>
-                                </div>
-                            </td>
-                            <td></td>
-                            <td>
+                            </div>
+                        </td>
+                        <td></td>
+                        <td>
+                            <a class="respondents">CIVIL</a><br><center>_</center>
+                        </td>
+                        <td></td>
+                        <td>
+                            <a target="_blank" href="https://api.sci.gov.in/jonew/judis/25825.pdf">15-01-2004(English)</a><br/><a><br/></a> target="_blank"
+                        </td>
+                    </tr>
+                    <tr id="001ea78633dd4e7692a0831f616b" data-diary-no="12/2004">
+                        <td>2</td>
+                        <td>12/2004</td>
+                        <td>C.A. No.-000131-000131 - 2004</td>
+                        <td class="petitioners text-center">
+                            <div>
                                 <a class="respondents">CIVIL</a><br><center>_</center>
-                            </td>
-                            <td></td>
-                            <td>
-                                <a target="_blank" href="https://api.sci.gov.in/jonew/judis/25826.pdf">16-01-2004(English)</a><br/><a><br/></a> target="_blank"
-                            </td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-            '''
-        }
+                            </div>
+                        </td>
+                        <td></td>
+                        <td>
+                            <a class="respondents">CIVIL</a><br><center>_</center>
+                        </td>
+                        <td></td>
+                        <td>
+                            <a target="_blank" href="https://api.sci.gov.in/jonew/judis/25826.pdf">16-01-2004(English)</a><br/><a><br/></a> target="_blank"
+                        </td>
+                    </tr>
+                </tbody>
+            </table>
+        </div>
+        '''
     }
+}
+
+def test_complete_workflow():
+    """Test the complete workflow from API response to MongoDB"""
+    print("=== Complete Workflow Test ===")
     
     # Initialize scraper
-    scraper = SupremeCourtScraper(config)
+    scraper = get_scraper()
     
     # Test JSON parsing
     print("\n1. Testing JSON parsing...")
-    judgments = scraper._parse_json_for_judgments(sample_response)
+    judgments = scraper._parse_json_for_judgments(_SAMPLE_RESPONSE)
     print(f"   Extracted {len(judgments)} judgments")
     
-    for i, judgment in enumerate(judgments, 1):
-        print(f"\n   Judgment {i}:")
-        for key, value in judgment.items():
-            print(f"     {key}: {value}")
+    print(format_judgments(judgments, '   Judgment', '     '))
     
     # Test MongoDB saving
     print("\n2. Testing MongoDB saving...")
@@ -118,7 +113,7 @@ def test_complete_workflow():
     # Simulate captured response
     mock_response = {
         'url': 'https://www.sci.gov.in/wp-admin/admin-ajax.php?action=get_judgements_judgement_date',
-        'body': json.dumps(sample_response),
+        'parsed': _SAMPLE_RESPONSE,
         'status': 200,
         'headers': {'content-type': 'application/json'}
     }
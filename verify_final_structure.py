@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 
-from mongodb_client import MongoDBClient
+from mongodb_client import get_shared_client
 from config import config
 
 def verify_final_structure():
-    client = MongoDBClient(config.mongo)
+    client = get_shared_client(config.mongo)
     
-    # Get sample documents
-    sample_docs = list(client.collection.find({}).limit(3))
+    # Get sample documents, fetching only the fields printed below in a single batch
+    sample_docs = list(client.collection.find(
+        {},
+        {'judgment_id': 1, 'judgment_links': 1, 'pdf_links': 1, '_id': 0},
+        batch_size=3
+    ).limit(3))
     
     print("Final verification of judgment_links format:")
     print("=" * 50)
@@ -33,10 +37,17 @@ def verify_final_structure():
             print(f"First pdf link type: {type(pdf_links[0])}")
             print(f"First pdf link: {pdf_links[0]}")
     
-    # Final count verification
-    total_docs = client.collection.count_documents({})
-    docs_with_judgment_links = client.collection.count_documents({'judgment_links': {'$exists': True, '$ne': []}})
-    docs_with_pdf_links = client.collection.count_documents({'pdf_links': {'$exists': True, '$ne': []}})
+    # Final count verification, all three counts in one aggregation round trip
+    counts = next(client.collection.aggregate([{'$facet': {
+        'total': [{'$count': 'n'}],
+        'with_judgment_links': [{'$match': {'judgment_links': {'$exists': True, '$ne': []}}}, {'$count': 'n'}],
+        'with_pdf_links': [{'$match': {'pdf_links': {'$exists': True, '$ne': []}}}, {'$count': 'n'}]
+    }}]))
+    # $count emits nothing for an empty match, leaving that facet empty
+    total_docs, docs_with_judgment_links, docs_with_pdf_links = (
+        counts[facet][0]['n'] if counts[facet] else 0
+        for facet in ('total', 'with_judgment_links', 'with_pdf_links')
+    )
     
     print(f"\n" + "=" * 50)
     print("SUMMARY:")
@@ -45,8 +56,6 @@ def verify_final_structure():
     print(f"Documents with pdf_links: {docs_with_pdf_links}")
     print("\n✅ SUCCESS: judgment_links and pdf_links are now stored as arrays of strings!")
     print("Format: judgments: ['link1', 'link2'] ✓")
-    
-    client.close()
 
 if __name__ == "__main__":
     verify_final_structure()
\ No newline at end of file
@@ -7,20 +7,48 @@ and the application is ready to run.
 """
 
 import sys
-import importlib
+import os
+import io
+import json
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Per-thread output buffer installed while a check runs on a worker thread
+_check_output = threading.local()
+
+class _ThreadRoutedStdout:
+    """stdout stand-in that sends each worker thread's writes to its own buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        return getattr(_check_output, 'buffer', self._stream).write(text)
+    
+    def flush(self):
+        getattr(_check_output, 'buffer', self._stream).flush()
+
+def _run_buffered(check):
+    """Run a check with its output captured, returning (passed, output)"""
+    _check_output.buffer = io.StringIO()
+    try:
+        return check(), _check_output.buffer.getvalue()
+    finally:
+        del _check_output.buffer
+
 def check_python_version():
     """Check if Python version is compatible"""
     print("\n🐍 Checking Python version...")
     version = sys.version_info
     print(f"   Python {version.major}.{version.minor}.{version.micro}")
     
-    if version.major == 3 and version.minor >= 8:
+    if version.major == 3 and version.minor >= 10:
         print("   ✅ Python version is compatible")
         return True
     else:
-        print("   ❌ Python 3.8+ required")
+        print("   ❌ Python 3.10+ required")
         return False
 
 def check_dependencies():
@@ -32,23 +60,28 @@ def check_dependencies():
         'requests', 
         'bs4',  # beautifulsoup4
         'lxml',
+        'selectolax',
         'pytesseract',
         'PIL',  # Pillow
         'cv2',  # opencv-python
         'pymongo',
         'boto3',
         'numpy',
+        'orjson',
         'dotenv',  # python-dotenv
         'yaml',  # pyyaml
         'loguru',
-        'tqdm'
+        'tqdm',
+        'httpx'
     ]
     
     missing_packages = []
     
     for package in required_packages:
         try:
-            importlib.import_module(package)
+            # Locate the package without importing it (and running its module code)
+            if importlib.util.find_spec(package) is None:
+                raise ImportError(package)
             print(f"   ✅ {package}")
         except ImportError:
             print(f"   ❌ {package} - NOT FOUND")
@@ -62,10 +95,47 @@ def check_dependencies():
     print("   ✅ All dependencies installed")
     return True
 
+def _playwright_browsers_dir(playwright_dir: Path) -> Path:
+    """Directory Playwright installs browsers into (PLAYWRIGHT_BROWSERS_PATH or the per-OS cache)"""
+    custom = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if custom == "0":
+        return playwright_dir / "driver" / "package" / ".local-browsers"
+    if custom:
+        return Path(custom)
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "ms-playwright"
+    if sys.platform == "win32":
+        return Path(os.environ.get("LOCALAPPDATA", Path.home())) / "ms-playwright"
+    return Path.home() / ".cache" / "ms-playwright"
+
+def _chromium_installed() -> bool:
+    """Check for the Chromium builds this Playwright version pins without launching one"""
+    import playwright
+    
+    playwright_dir = Path(playwright.__file__).parent
+    with open(playwright_dir / "driver" / "package" / "browsers.json") as f:
+        browsers = json.load(f)["browsers"]
+    
+    # Each finished install leaves a marker file in <name>-<revision>
+    browsers_dir = _playwright_browsers_dir(playwright_dir)
+    chromium_builds = [b for b in browsers if b["name"] in ("chromium", "chromium-headless-shell")]
+    return bool(chromium_builds) and all(
+        (browsers_dir / f"{b['name'].replace('-', '_')}-{b['revision']}" / "INSTALLATION_COMPLETE").exists()
+        for b in chromium_builds
+    )
+
 def check_playwright_browsers():
     """Check if Playwright browsers are installed"""
     print("\n🌐 Checking Playwright browsers...")
     
+    try:
+        if _chromium_installed():
+            print("   ✅ Playwright browsers installed")
+            return True
+    except Exception:
+        # Unknown driver layout; fall back to launching the browser
+        pass
+    
     try:
         from playwright.sync_api import sync_playwright
         
@@ -98,8 +168,12 @@ def check_project_files():
     
     missing_files = []
     
+    # One directory listing answers every top-level name; nested paths still stat
+    present = {entry.name for entry in os.scandir('.')}
+    
     for file in required_files:
-        if Path(file).exists():
+        found = file in present if os.sep not in file else Path(file).exists()
+        if found:
             print(f"   ✅ {file}")
         else:
             print(f"   ❌ {file} - NOT FOUND")
@@ -160,9 +234,20 @@ def main():
         check_application_import
     ]
     
+    # The checks are independent (the Playwright launch dominates), so run them
+    # together and replay each one's output in order once all have finished
+    stdout = sys.stdout
+    sys.stdout = _ThreadRoutedStdout(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            outcomes = list(executor.map(_run_buffered, checks))
+    finally:
+        sys.stdout = stdout
+    
     results = []
-    for check in checks:
-        results.append(check())
+    for passed, output in outcomes:
+        sys.stdout.write(output)
+        results.append(passed)
     
     print("\n" + "="*60)
     print("VERIFICATION SUMMARY")